@@ -1,12 +1,11 @@
 import math
 import time
-
-from about_time import about_time
+from functools import lru_cache
 
 from .utils import bordered, extract_fill_graphemes, fix_signature, spinner_player
 from ..utils import terminal
-from ..utils.cells import VS_15, combine_cells, fix_cells, has_wide, is_wide, join_cells, \
-    mark_graphemes, split_graphemes, strip_marks, to_cells
+from ..utils.cells import VS_15, Rendered, combine_cells, fix_cells, has_wide, is_wide, \
+    join_cells, mark_graphemes, split_graphemes, strip_marks, to_cells
 from ..utils.colors import BLUE, BLUE_BOLD, CYAN, DIM, GREEN, ORANGE, ORANGE_BOLD, RED, YELLOW_BOLD
 
 
@@ -36,7 +35,7 @@ def bar_factory(chars=None, *, tip=None, background=None, borders=None, errors=N
     """
 
     @bar_controller
-    def inner_bar_factory(length, spinner_factory=None):
+    def inner_bar_factory(length):
         if chars:
             if is_wide(chars[-1]):  # previous chars can be anything.
                 def fill_style(complete, filling):  # wide chars fill.
@@ -65,25 +64,37 @@ def bar_factory(chars=None, *, tip=None, background=None, borders=None, errors=N
             return border, texts
 
         @bordered(borders, '||')
-        def draw_known(apply_state, percent):
+        def render_known(apply_state, percent):
             virtual_fill = round(virtual_length * max(0., min(1., percent)))
             fill = fill_style(*divmod(virtual_fill, num_graphemes))
             border, texts = apply_state(fill)
             border = overflow if percent > 1. else None if percent == 1. else border
             return fix_cells(combine_cells(fill, tip, *texts)[len_tip:length + len_tip]), border
 
-        if spinner_factory:
+        def draw_known(apply_state, percent):
+            # there are only a few distinct frames, so each one is rendered only once.
+            if percent < 1.:
+                index = round(virtual_length * max(0., percent))
+            else:  # these two have the same fill, but different borders than just below 1.
+                index = virtual_length + (1 if percent == 1. else 2)
+            table = frames[apply_state]
+            frame = table[index]
+            if frame is None:
+                frame = table[index] = Rendered(render_known(apply_state, percent))
+            return frame
+
+        def unknown_factory(spinner_factory):
             @bordered(borders, '||')
             def draw_unknown(_percent=None):
                 return next(player), None
 
             player = spinner_player(spinner_factory(length))
-        else:
-            draw_unknown = None
+            return draw_unknown
 
         padding = (' ',) * len_tip + background * math.ceil((length + len_tip) / len(background))
         virtual_length, blanks = num_graphemes * (length + len_tip), (' ',) * length
-        return draw_known, running, ended, draw_unknown
+        frames = {state: [None] * (virtual_length + 3) for state in (running, ended)}
+        return draw_known, running, ended, unknown_factory
 
     assert chars or tip, 'tip is mandatory for transparent bars'
     assert not (chars and not is_wide(chars[-1]) and has_wide(chars)), \
@@ -108,8 +119,8 @@ def bar_controller(inner_bar_factory):
             a bar renderer
 
         """
-        with about_time() as t_compile:
-            draw_known, running, ended, draw_unknown = inner_bar_factory(length, spinner_factory)
+        (draw_known, running, ended, unknown_factory), t_compile = assemble(length)
+        draw_unknown = unknown_factory(spinner_factory) if spinner_factory else None
 
         def draw(percent):
             return draw_known(running, percent)
@@ -133,6 +144,12 @@ def bar_controller(inner_bar_factory):
 
         return draw
 
+    @lru_cache(maxsize=16)  # the known mode renderers are stateless, so they can be shared.
+    def assemble(length):
+        from about_time import about_time  # must not be on top.
+        with about_time() as t_compile:
+            return inner_bar_factory(length), t_compile
+
     def compile_and_check(*args, **kwargs):  # pragma: no cover
         """Compile this bar factory at some length, and..."""
         # since a bar does not have a natural length, I have to choose one...
@@ -1,15 +1,14 @@
 import operator
 import random
 import time
+from functools import lru_cache
 from inspect import signature
 from itertools import chain, count, islice, repeat
 from types import SimpleNamespace
 
-from about_time import about_time
-
 from .utils import fix_signature
 from ..utils import terminal
-from ..utils.cells import fix_cells, is_wide, join_cells, strip_marks, to_cells
+from ..utils.cells import Rendered, fix_cells, is_wide, join_cells, strip_marks, to_cells
 from ..utils.colors import BLUE, BLUE_BOLD, CYAN, DIM, GREEN, ORANGE, ORANGE_BOLD, RED, YELLOW_BOLD
 
 
@@ -31,10 +30,19 @@ def spinner_controller(*, natural, skip_compiler=False):
             if skip_compiler:
                 return spinner_inner_factory(actual_length, **op_params)
 
+            spec, t_compile = compile_spec(actual_length)
+            spec = SimpleNamespace(**vars(spec))  # the runner changes it, but not the frame data.
+            return spinner_runner_factory(spec, t_compile, extra_commands.get(False, ()))
+
+        @lru_cache(maxsize=16)  # each length is compiled only once, the data is immutable.
+        def compile_spec(actual_length):
+            from about_time import about_time  # must not be on top.
             with about_time() as t_compile:
                 gen = spinner_inner_factory(actual_length, **op_params)
                 spec = spinner_compiler(gen, natural, extra_commands.get(True, ()))
-            return spinner_runner_factory(spec, t_compile, extra_commands.get(False, ()))
+                # the frames are joined only once here, instead of on every refresh.
+                spec.data = tuple(tuple(Rendered(frame) for frame in cycle) for cycle in spec.data)
+            return spec, t_compile
 
         def compile_and_check(*args, **kwargs):  # pragma: no cover
             """Compile this spinner factory at its natural length, and..."""
@@ -1,4 +1,5 @@
 import math
+import time
 
 
 def calibrated_fps(calibrate):
@@ -43,3 +44,50 @@ def custom_fps(refresh_secs):
 
     refresh_secs = 1 / refresh_secs
     return fps
+
+
+def budgeted_fps(fps, budget):
+    """Governor of the frames per second engine, which measures how long each frame actually
+    takes to render, and caps the refresh rate so the rendering stays within a CPU budget.
+
+    Wide terminals, wide chars or a slow file make each frame more expensive, so the maximum
+    fps within the budget is simply budget / cost, and the refresh degrades smoothly as the
+    frames get heavier, instead of burning a core at 60 fps.
+
+    Args:
+        fps: the fps callable to be governed
+        budget (float): the maximum fraction of a CPU core to spend rendering, 0 for unlimited
+
+    Returns:
+        a callable to calculate the fps, with a `measure(start)` function to be called after
+        each frame, and `achieved()` and `load()` functions to monitor it
+
+    """
+
+    def governed(rate):
+        target = fps(rate)
+        if budget and measure.cost:
+            return min(target, budget / measure.cost)
+        return target
+
+    def measure(start):  # start is when the frame began rendering.
+        measure.cost = smooth(measure.cost, time.perf_counter() - start)
+        if measure.last:
+            measure.interval = smooth(measure.interval, start - measure.last)
+        measure.last = start
+
+    def smooth(value, sample):
+        return sample if not value else value + alpha * (sample - value)
+
+    def achieved():
+        """The actual frames per second, as the frames may come slower than calculated."""
+        return 1. / measure.interval if measure.interval else 0.
+
+    def load():
+        """The fraction of a CPU core spent rendering."""
+        return min(1., measure.cost / measure.interval) if measure.interval else 0.
+
+    alpha = .3
+    measure.cost, measure.interval, measure.last = 0., 0., 0.
+    governed.measure, governed.achieved, governed.load = measure, achieved, load
+    return governed
@@ -3,6 +3,7 @@ This module must always be importable, even without the required libs for instal
 It's because I import metadata from main init, directly in setup.py, which imports this.
 """
 import os
+import re
 import sys
 from collections import namedtuple
 from string import Formatter
@@ -46,12 +47,12 @@ def __name_lookup(name_lookup):
 def __func_lookup(module_lookup, inner_name):
     def _input(x):
         if isinstance(x, FunctionType):
-            func_file, _ = os.path.splitext(module_lookup.__file__)
             if x.__code__.co_name == inner_name \
                     and func_file.endswith(os.path.splitext(x.__code__.co_filename)[0]):
                 return x
             return ERROR
 
+    func_file, _ = os.path.splitext(module_lookup.__file__)
     return _input
 
 
@@ -136,10 +137,31 @@ def _file_input_factory():
     return _input
 
 
+def _metrics_input_factory():
+    def _input(x):
+        if not x:
+            return None
+        if isinstance(x, int) and not isinstance(x, bool):
+            return x if 1 <= x <= 65535 else ERROR
+        address = address_re.fullmatch(x) if isinstance(x, str) else None
+        if address:  # an HTTP host:port to serve.
+            host, port = address[1].strip('[]'), int(address[2])
+            return (host, port) if 1 <= port <= 65535 else ERROR
+        if isinstance(x, (str, os.PathLike)):
+            return os.fspath(x)
+        return ERROR
+
+    address_re = re.compile(r'(\[[\da-fA-F:.]*]|[\w.-]*):(\d+)')
+    _input.err_help = 'Expected an HTTP port or host:port to serve, or a file path to write'
+    return _input
+
+
 Config = namedtuple('Config', 'title length max_cols spinner bar unknown force_tty disable manual '
-                              'enrich_print enrich_offset receipt receipt_text monitor elapsed stats '
-                              'title_length spinner_length refresh_secs monitor_end elapsed_end '
-                              'stats_end ctrl_c dual_line unit scale precision file')
+                              'fast enrich_print enrich_offset receipt receipt_text monitor elapsed '
+                              'stats title_length spinner_length refresh_secs monitor_end '
+                              'elapsed_end stats_end ctrl_c threads processes renderer dual_line '
+                              'unit scale precision file json_secs metrics render_budget '
+                              'perf estimator')
 
 
 def create_config():
@@ -154,6 +176,7 @@ def create_config():
             file=sys.stdout,
             disable=False,
             manual=False,
+            fast=False,
             enrich_print=True,
             enrich_offset=0,
             receipt=True,
@@ -167,7 +190,15 @@ def create_config():
             title_length=0,
             spinner_length=0,
             refresh_secs=0,
+            render_budget=0,
+            perf=False,
+            estimator='smooth',
             ctrl_c=True,
+            threads=False,
+            processes=0,
+            renderer='thread',
+            json_secs=0,
+            metrics=None,
             dual_line=False,
             unit='',
             scale=None,
@@ -183,12 +214,29 @@ def create_config():
         """
         lazy_init()
         global_config.update(_parse(theme, options))
+        snapshot.clear()
 
-    def create_context(theme=None, **options):
-        """Create an immutable copy of the current configuration, with optional customization."""
+    def create_context(theme=None, *, config=None, **options):
+        """Create an immutable copy of the current configuration, with optional customization.
+        A prevalidated `config`, like a profile, can be used instead of the global one."""
         lazy_init()
-        local_config = {**global_config, **_parse(theme, options)}
-        return Config(**local_config)
+        if config is None:
+            # the global one only changes in set_global, so it is shared until then.
+            config = snapshot.get('global') or snapshot.setdefault('global',
+                                                                   Config(**global_config))
+        elif not isinstance(config, Config):
+            raise TypeError(f'Expected a Config, like a profile, got {type(config).__name__!r}.')
+        return config._replace(**_parse(theme, options)) if theme or options else config
+
+    def profile(theme=None, **options):
+        """Create a reusable configuration, already validated, from the current global one.
+        Send it to alive bars as `config=profile` to skip validating the same options every time.
+
+        See Also:
+            alive_progress#alive_bar(**options)
+
+        """
+        return create_context(theme, **options)
 
     def _parse(theme, options):
         """Validate and convert some configuration options."""
@@ -209,14 +257,21 @@ def create_config():
             except Exception as e:
                 raise ValueError(f'Error in config value: {key}={value!r}\nCause: {e!r}') from None
 
-        from ..styles.internal import THEMES
-        if theme:
-            if theme not in THEMES:
-                raise ValueError(f'invalid theme name={theme}')
-            swap = options
-            options = dict(THEMES[theme])
-            options.update(swap)
-        return {k: validator(k, v) for k, v in options.items()}
+        def expand(name):
+            from ..styles.internal import THEMES  # must not be on top.
+            if name not in THEMES:
+                raise ValueError(f'invalid theme name={name}')
+            items = tuple(THEMES[name].items())
+            try:
+                return dict(expanded[items])
+            except KeyError:  # themes are usually the same few, so each is only validated once.
+                return dict(expanded.setdefault(items, {k: validator(k, v) for k, v in items}))
+            except TypeError:  # there's something unhashable, so it can't be memoized.
+                return {k: validator(k, v) for k, v in items}
+
+        result = expand(theme) if theme else {}
+        result.update((k, validator(k, v)) for k, v in options.items())
+        return result
 
     def lazy_init():
         if validations:
@@ -233,6 +288,7 @@ def create_config():
             file=_file_input_factory(),
             disable=_bool_input_factory(),
             manual=_bool_input_factory(),
+            fast=_bool_input_factory(),
             enrich_print=_bool_input_factory(),
             enrich_offset=_int_input_factory(0, sys.maxsize),
             receipt=_bool_input_factory(),
@@ -246,7 +302,15 @@ def create_config():
             title_length=_int_input_factory(0, 1000),
             spinner_length=_int_input_factory(0, 1000),
             refresh_secs=_float_input_factory(0, 60 * 60 * 24),  # maximum 24 hours.
+            render_budget=_float_input_factory(0, 1),  # a fraction of a CPU core.
+            perf=_bool_input_factory(),
+            estimator=_options_input_factory(('smooth', 'ewma', 'window', 'regression'), {}),
             ctrl_c=_bool_input_factory(),
+            threads=_bool_input_factory(),
+            processes=_int_input_factory(0, 1000),
+            renderer=_options_input_factory(('thread', 'asyncio', 'pull'), {}),
+            json_secs=_float_input_factory(0, 60 * 60 * 24),  # maximum 24 hours.
+            metrics=_metrics_input_factory(),
             dual_line=_bool_input_factory(),
             # title_effect=_enum_input_factory(),  # TODO someday.
             unit=_text_input_factory(),
@@ -261,8 +325,9 @@ def create_config():
         reset()
         assert all(k in global_config for k in Config._fields)  # ensures all fields have been set.
 
-    global_config, validations = {}, {}
+    global_config, validations, snapshot, expanded = {}, {}, {}, {}
     create_context.set_global, create_context.reset = set_global, reset
+    create_context.profile = profile
     return create_context
 
 
@@ -0,0 +1,119 @@
+"""
+Counters that let workers advance a bar from elsewhere, without any locks or round-trips.
+"""
+import atexit
+import sys
+from multiprocessing import shared_memory
+
+
+class SharedCounters:
+    """An array of counters in shared memory, with one slot for each worker process.
+
+    Each worker must only ever write to its own slot, which is what makes them safe without
+    any locks, while the bar sums them all up on each refresh.
+    Send the slots themselves to the workers, they are tiny and picklable:
+
+    >>> with alive_bar(total, processes=4) as bar:
+    ...     with ProcessPoolExecutor(4) as executor:
+    ...         for i, chunk in enumerate(split(items, 4)):
+    ...             executor.submit(work, chunk, bar.shared[i])
+
+    >>> def work(chunk, progress):
+    ...     for item in chunk:
+    ...         # process item.
+    ...         progress()  # or progress(n).
+
+    """
+
+    def __init__(self, slots):
+        self._shm = shared_memory.SharedMemory(create=True, size=8 * slots)
+        self._view = self._shm.buf.cast('q')  # it is created zero-filled.
+        self.slots = slots
+
+    def __len__(self):
+        return self.slots
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.slots:
+            raise IndexError(f'slot {index} out of range, there are {self.slots} slots.')
+        return SharedSlot(self._shm.name, index)
+
+    def total(self):
+        return sum(self._view)
+
+    def close(self):
+        """Release and destroy the shared memory, no worker can advance the bar anymore."""
+        self._view.release()
+        self._shm.close()
+        self._shm.unlink()
+
+
+class SharedSlot:
+    """A picklable handle to one of the shared counters, to be called in a worker process.
+
+    It attaches to the shared memory on the first call, and detaches when the last handle to
+    it in this process is gone, usually when the task that received it finishes, so reused
+    worker pools do not keep the memories of bars that have already ended.
+    """
+
+    __slots__ = ('index', 'name', 'view')
+
+    def __init__(self, name, index):
+        self.name, self.index, self.view = name, index, None
+
+    def __reduce__(self):
+        return SharedSlot, (self.name, self.index)
+
+    def __call__(self, count=1):
+        view = self.view
+        if view is None:
+            view = self.view = _attach(self.name)
+        view[self.index] += count
+
+    def __del__(self):
+        if self.view is not None:
+            self.view = None
+            _detach(self.name)
+
+
+_attached = {}  # the shared memories this process is attached to, their views and handles.
+
+
+def _attach(name):
+    entry = _attached.get(name)
+    if entry is None:
+        if sys.version_info >= (3, 13):
+            # the owner process is the one responsible for destroying it.
+            shm = shared_memory.SharedMemory(name, track=False)
+        else:  # pragma: no cover
+            shm = shared_memory.SharedMemory(name)
+            from multiprocessing import resource_tracker  # must not be on top.
+            resource_tracker.unregister(shm._name, 'shared_memory')  # the same, but by hand.
+        entry = _attached[name] = [shm, shm.buf.cast('q'), 0]
+    entry[2] += 1
+    return entry[1]
+
+
+def _detach(name):
+    entry = _attached.get(name)
+    if entry is None:  # already detached at exit.
+        return
+    entry[2] -= 1
+    if not entry[2]:
+        del _attached[name]
+        _release(entry)
+
+
+def _release(entry):
+    shm, view, _ = entry
+    view.release()  # otherwise, the shared memory can't be closed.
+    shm.close()
+
+
+def _detach_all():
+    for entry in _attached.values():
+        _release(entry)
+    _attached.clear()
+
+
+atexit.register(_detach_all)
@@ -0,0 +1,142 @@
+"""
+Exports the status of all the active bars in the OpenMetrics text format, either served on an
+HTTP port, or written atomically to a file, like the ones of textfile collectors.
+"""
+import math
+import os
+import socket
+import threading
+import time
+import warnings
+from itertools import count
+from types import SimpleNamespace
+
+EXPORT_SECS = 1.  # the minimum period between file writes, and the refresh without a tty.
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+METRICS = (  # name, help, and the index in the status tuple (title is 0).
+    ('count', 'The current count of the bar.', 1),
+    ('total', 'The expected total of the bar, if known.', 2),
+    ('rate', 'The smoothed rate of the bar, per second.', 3),
+    ('eta_seconds', 'The estimated time to complete the bar, if known.', 4),
+    ('elapsed_seconds', 'The time elapsed since the bar started.', 5),
+)
+
+
+def get_exporter(target):
+    """Get the exporter of a target, which is shared by all the bars sent to it.
+
+    Args:
+        target (Union[int, tuple[str, int], str]): a local HTTP port to serve, a (host, port)
+            address to serve on, or a file path to write
+
+    Returns:
+        the exporter, with `update(key, status)` and `remove(key)` functions
+
+    """
+    if isinstance(target, int):  # only local by default.
+        target = '127.0.0.1', target
+    elif isinstance(target, tuple) and not target[0]:  # the same address, so the same exporter.
+        target = '0.0.0.0', target[1]  # explicitly requested.
+    with _lock:
+        exporter = _exporters.get(target)
+        if exporter is None:
+            factory = _http_exporter if isinstance(target, tuple) else _file_exporter
+            exporter = _exporters[target] = factory(target)
+        return exporter
+
+
+_exporters, _lock, next_key = {}, threading.Lock(), count(1).__next__
+
+
+def _create_exporter(publish):
+    def update(key, status):
+        """Update a bar status, a tuple with (title, count, total, rate, eta, elapsed)."""
+        with lock:
+            bars[key] = status
+            publish(False)
+
+    def remove(key):
+        with lock:
+            if bars.pop(key, None):
+                publish(True)
+
+    def render():
+        lines = []
+        for name, descr, index in METRICS:
+            lines += f'# TYPE alive_progress_{name} gauge', f'# HELP alive_progress_{name} {descr}'
+            lines.extend(f'alive_progress_{name}{{bar="{key}",title="{_escape(status[0])}"}} '
+                         f'{_number(status[index])}' for key, status in bars.items()
+                         if status[index] is not None)
+        lines.append('# EOF\n')
+        return '\n'.join(lines)
+
+    def rendered():  # for other threads, like the http server ones.
+        with lock:
+            return render()
+
+    bars, lock = {}, threading.Lock()
+    return SimpleNamespace(update=update, remove=remove, render=render, rendered=rendered)
+
+
+def _number(value):
+    if value != value:  # noqa: PLR0124, only NaN is not equal to itself.
+        return 'NaN'
+    if value in (math.inf, -math.inf):
+        return '+Inf' if value > 0 else '-Inf'
+    return value
+
+
+def _escape(title):
+    return (title or '').replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _http_exporter(address):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # must not be on top.
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = exporter.rendered().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):  # no noise in the terminal, where the bars are.
+            pass
+
+    def publish(_force):  # the scrapes fetch the status on demand.
+        pass
+
+    class MetricsServer(ThreadingHTTPServer):
+        address_family = socket.AF_INET6 if ':' in address[0] else socket.AF_INET
+        daemon_threads = True
+
+    exporter = _create_exporter(publish)
+    try:
+        exporter.server = MetricsServer(address, MetricsHandler)
+    except OSError as e:  # the metrics are best effort, they must not break the bars.
+        warnings.warn(f'Metrics not exported on {address[0]}:{address[1]}: {e}', stacklevel=2)
+        exporter.server = None  # the exporter is cached anyway, so it warns only once.
+        return exporter
+    threading.Thread(target=exporter.server.serve_forever, daemon=True).start()
+    return exporter
+
+
+def _file_exporter(path):
+    def publish(force):  # the render thread refreshes way more often than collectors read.
+        now = time.perf_counter()
+        if not force and now - publish.last_write < EXPORT_SECS:
+            return
+        publish.last_write = now
+        temp = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temp, 'w', encoding='utf-8') as f:
+                f.write(exporter.render())
+            os.replace(temp, path)  # atomic, collectors never see a partial file.
+        except OSError:  # the metrics are best effort, they must not break the bars.
+            pass
+
+    publish.last_write = 0.
+    exporter = _create_exporter(publish)
+    return exporter
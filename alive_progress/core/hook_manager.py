@@ -1,12 +1,13 @@
-import logging
 import sys
-from collections import defaultdict
+import threading
+import time
+from collections import defaultdict, deque
 from itertools import chain, islice, repeat
-from logging import StreamHandler
 from types import SimpleNamespace
 
 # support for click.echo, which calls `write` with bytes instead of str.
 ENCODING = sys.getdefaultencoding()
+MAX_QUEUED = 1000  # beyond this, the deferred writes are emitted right away, under the lock.
 
 
 def buffered_hook_manager(header_template, get_pos, offset, cond_refresh, term):
@@ -26,11 +27,17 @@ def buffered_hook_manager(header_template, get_pos, offset, cond_refresh, term):
     """
 
     def flush_buffers():
+        if hook_manager.deferred:  # the header must be taken now, before the index changes.
+            if queue or hook_manager.partial:
+                queue.append((None, None, get_header()))
+            return
         for stream, buffer in buffers.items():
             flush(stream)
 
     def flush(stream):
-        if buffers[stream]:
+        if hook_manager.deferred:
+            queue.append((stream, None, get_header()))
+        elif buffers[stream]:
             write(stream, '\n')  # when the current index is about to change, send a newline.
             stream.flush()
 
@@ -38,7 +45,13 @@ def buffered_hook_manager(header_template, get_pos, offset, cond_refresh, term):
         if isinstance(part, bytes):
             part = part.decode(ENCODING)
 
-        buffer = buffers[stream]
+        try:  # any thread may print, and without the lock, so each one counts in its own tally.
+            tally = local.tally
+        except AttributeError:
+            tally = local.tally = [0]
+            tallies.append(tally)
+        tally[0] += 1
+
         if part != '\n':
             osc = part.find('\x1b]')  # https://en.wikipedia.org/wiki/ANSI_escape_code
             if osc >= 0:
@@ -52,25 +65,79 @@ def buffered_hook_manager(header_template, get_pos, offset, cond_refresh, term):
                 part = part[:osc] + part[end + s:]
                 if not part:
                     return
-            with cond_refresh:
-                # this will generate a sequence of lines interspersed with None, which will later
-                # be rendered as the indent filler to align additional lines under the same header.
-                gen = chain.from_iterable(zip(repeat(None), part.split('\n')))
-                buffer.extend(islice(gen, 1, None))
-        else:
-            with cond_refresh:
-                if stream in base:  # pragma: no cover
-                    term.clear_line()
-                    term.clear_end_screen()
-                if buffer:
-                    header = get_header()
-                    spacer = '\n' + ' ' * len(header)
-                    nested = ''.join(spacer if line is None else line for line in buffer)
-                    buffer[:] = []
-                    stream.write(f'{header}{nested.rstrip()}')
-                stream.write('\n')
-                stream.flush()
-                cond_refresh.notify()
+
+        if hook_manager.deferred:
+            if len(queue) < MAX_QUEUED:  # the render thread emits it, with the next frame.
+                queue.append((stream, part, get_header() if part == '\n' else None))
+                hook_manager.wake()
+                return
+            with acquire():  # a flood of prints, so the memory is bounded, and the order kept.
+                drain()
+                emit(stream, part)
+            return
+
+        with acquire():
+            emit(stream, part)
+
+    def emit(stream, part, header=None):  # the caller must be holding the lock.
+        buffer = buffers[stream]
+        if part != '\n':
+            # this will generate a sequence of lines interspersed with None, which will later
+            # be rendered as the indent filler to align additional lines under the same header.
+            gen = chain.from_iterable(zip(repeat(None), part.split('\n')))
+            buffer.extend(islice(gen, 1, None))
+            return
+
+        if stream in base:  # pragma: no cover
+            term.clear_line()
+            term.clear_end_screen()
+        if buffer:
+            header = get_header() if header is None else header
+            spacer = '\n' + ' ' * len(header)
+            nested = ''.join(spacer if line is None else line for line in buffer)
+            buffer[:] = []
+            stream.write(f'{header}{nested.rstrip()}')
+        stream.write('\n')
+        stream.flush()
+        hook_manager.flushes += 1
+        hook_manager.printed = True  # the bar must be redrawn, even if unchanged.
+        cond_refresh.notify()
+
+    def writes():
+        return sum(tally[0] for tally in tuple(tallies))
+
+    def wake():  # the refresh thread, without the lock, even if it's rendering right now.
+        wakeup.set()
+
+    def wait(timeout):
+        """Wait for a deferred write or a wake, the caller must be holding the lock, which is
+        released meanwhile. They are never lost, as the event stays set until it's seen."""
+        cond_refresh.release()
+        try:
+            wakeup.wait(timeout)
+            wakeup.clear()  # any write after this is still in the queue, for the next drain.
+        finally:
+            cond_refresh.acquire()
+
+    def drain():
+        """Emit the deferred writes, the caller must be holding the lock."""
+        for _ in range(len(queue)):  # only the current ones, the frame must not starve.
+            stream, part, header = queue.popleft()
+            if part is not None:
+                emit(stream, part, header)
+                continue
+            for each in tuple(buffers) if stream is None else (stream,):  # a flush.
+                if buffers[each]:
+                    emit(each, '\n', header)
+                    each.flush()
+        hook_manager.partial = any(buffers.values())
+
+    def acquire():  # only measures the time waited when the renderer is holding the lock.
+        if not cond_refresh.acquire(blocking=False):
+            start = time.perf_counter()
+            cond_refresh.acquire()
+            hook_manager.lock_wait += time.perf_counter() - start
+        return locked
 
     # better hook impl, which works even when nested, since __hash__ will be forwarded.
     class Hook(BaseHook):
@@ -86,6 +153,8 @@ def buffered_hook_manager(header_template, get_pos, offset, cond_refresh, term):
         return Hook(handler.stream)
 
     def install():
+        import logging  # must not be on top.
+
         def get_all_loggers():
             yield logging.root
             yield from (logging.getLogger(name) for name in logging.root.manager.loggerDict)
@@ -98,19 +167,25 @@ def buffered_hook_manager(header_template, get_pos, offset, cond_refresh, term):
 
         # account for reused handlers within loggers.
         handlers = set(h for logger in get_all_loggers()
-                       for h in logger.handlers if isinstance(h, StreamHandler))
+                       for h in logger.handlers if isinstance(h, logging.StreamHandler))
         # modify all stream handlers, including their subclasses.
         before_handlers.update({h: set_hook(h) for h in handlers})  # there can be Nones now.
         sys.stdout, sys.stderr = (get_hook_for(SimpleNamespace(stream=x)) for x in base)
 
     def uninstall():
-        flush_buffers()
-        buffers.clear()
+        if not hook_manager.deferred:
+            flush_buffers()
         sys.stdout, sys.stderr = base
 
         [handler.setStream(original) for handler, original in before_handlers.items() if original]
         before_handlers.clear()
 
+        if hook_manager.deferred:  # nothing else is captured now, so all pending ones are emitted.
+            queue.append((None, None, get_header()))
+            with acquire():
+                drain()
+        buffers.clear()
+
         # did the number of logging handlers change??
         # if yes, it probably means logging was initialized within alive_bar context,
         # and thus there can be an instrumented stdout or stderr within handlers,
@@ -125,17 +200,43 @@ def buffered_hook_manager(header_template, get_pos, offset, cond_refresh, term):
     get_header = gen_header(header_template, get_pos, offset)
     base = sys.stdout, sys.stderr  # needed for tests.
     before_handlers = {}
+    locked = Locked(cond_refresh)
+    queue = deque()  # appends and pops are atomic, so the writes don't need the lock.
+    local, tallies = threading.local(), []
+    wakeup = threading.Event()
 
     # external interface.
     hook_manager = SimpleNamespace(
         flush_buffers=flush_buffers,
         install=install,
         uninstall=uninstall,
+        drain=drain,
+        wake=wake,
+        wait=wait,
+        printed=False,
+        deferred=False,
+        partial=False,
+        writes=writes,
+        flushes=0,
+        lock_wait=0.,
     )
 
     return hook_manager
 
 
+class Locked:
+    """A context that only releases a lock, which was already acquired."""
+
+    def __init__(self, lock):
+        self._lock = lock
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, _type, value, traceback):
+        self._lock.release()
+
+
 class BaseHook:
     def __init__(self, stream):
         self._stream = stream
@@ -148,6 +249,12 @@ def passthrough_hook_manager():  # pragma: no cover
     passthrough_hook_manager.flush_buffers = __noop
     passthrough_hook_manager.install = __noop
     passthrough_hook_manager.uninstall = __noop
+    passthrough_hook_manager.drain = __noop
+    passthrough_hook_manager.wake = __noop
+    passthrough_hook_manager.printed = False
+    passthrough_hook_manager.writes = __zero
+    passthrough_hook_manager.flushes = 0
+    passthrough_hook_manager.lock_wait = 0.
     return passthrough_hook_manager
 
 
@@ -155,6 +262,10 @@ def __noop():  # pragma: no cover
     pass
 
 
+def __zero():  # pragma: no cover
+    return 0
+
+
 def gen_header(header_template, get_pos, offset):  # pragma: no cover
     def header():
         return header_template.format(get_pos() + offset)
@@ -6,20 +6,24 @@ import math
 import threading
 import time
 import io
+from collections import namedtuple
 from contextlib import contextmanager
-from typing import Any, Callable, Optional, TypeVar
-from collections.abc import Collection, Iterable
-
-from .calibration import calibrated_fps, custom_fps
-from .configuration import config_handler
-from .hook_manager import buffered_hook_manager, passthrough_hook_manager
+from functools import wraps
+from types import SimpleNamespace
+from typing import Any, Callable, Optional, TypeVar, Union, overload
+from collections.abc import AsyncIterable, Iterable
+
+from .calibration import budgeted_fps, calibrated_fps, custom_fps
+from .configuration import Config, config_handler
+from .exporter import EXPORT_SECS, get_exporter, next_key
+from .hook_manager import Locked, buffered_hook_manager, passthrough_hook_manager
 from ..utils import terminal
-from ..utils.cells import combine_cells, fix_cells, print_cells, to_cells
-from ..utils.timing import eta_text, fn_simple_eta, gen_simple_exponential_smoothing, \
-    time_display, RUN, END
+from ..utils.cells import Rendered, combine_cells, fix_cells, render_cells, to_cells
+from ..utils.timing import create_estimators, eta_text, time_display, RUN, END
 
 
-def alive_bar(total: Optional[int] = None, *, calibrate: Optional[int] = None, **options: Any):
+def alive_bar(total: Optional[int] = None, *, calibrate: Optional[int] = None,
+              config: Optional[Config] = None, **options: Any):
     """An alive progress bar to keep track of lengthy operations.
     It has a spinner indicator, elapsed time, throughput and ETA.
     When the operation finishes, a receipt is displayed with statistics.
@@ -62,6 +66,13 @@ def alive_bar(total: Optional[int] = None, *, calibrate: Optional[int] = None, *
     ...        for i in range(1000):
     ...            time.sleep(.005)
     ...            bar()
+    It also works in asyncio code, within an `async with` block. Use the 'asyncio' renderer to
+    refresh the bar from the running event loop instead of a thread:
+    >>> async with alive_bar(1000, renderer='asyncio') as bar:
+    ...     for i in range(1000):
+    ...         await asyncio.sleep(.005)
+    ...         bar()
+
     Expected results are these (but you have to see them in motion!):
 |████████████████████████████████████████| 1000/1000 [100%] in 6.0s (167.93/s)
 |██████████████████████████▋⚠            | (!) 1000/1500 [67%] in 6.0s (167.57/s)
@@ -71,6 +82,8 @@ def alive_bar(total: Optional[int] = None, *, calibrate: Optional[int] = None, *
     Args:
         total (Optional[int]): the total expected count
         calibrate (float): maximum theoretical throughput to calibrate animation speed
+        config (Optional[Config]): a profile from `config_handler.profile()`, which is used
+            instead of the global configuration, already validated
         **options: custom configuration options, which override the global configuration:
             title (Optional[str]): an optional, always visible bar title
             length (int): the number of cols to render the actual bar in alive_bar
@@ -90,6 +103,9 @@ def alive_bar(total: Optional[int] = None, *, calibrate: Optional[int] = None, *
             file (object): use `sys.stdout`, `sys.stderr`, or a similar `TextIOWrapper` object
             disable (bool): if True, completely disables all output, do not install hooks
             manual (bool): set to manually control the bar position
+            fast (bool): if True, `bar()` only increments the counters, deferring all the other
+                bookkeeping to the refresh thread (the count must be an int, and it's only
+                clamped at zero on refresh)
             enrich_print (bool): enriches print() and logging messages with the bar position
             enrich_offset (int): the offset to apply to enrich_print
             receipt (bool): prints the nice final receipt, disables if False
@@ -110,7 +126,26 @@ def alive_bar(total: Optional[int] = None, *, calibrate: Optional[int] = None, *
                 title will be truncated if longer, and a cool ellipsis "…" will appear at the end
             spinner_length (int): forces the spinner length, or `0` for its natural one
             refresh_secs (int): forces the refresh period, `0` for the reactive visual feedback
+            estimator (str): how the rate and ETA are estimated: 'smooth', 'ewma', 'window' or
+                'regression', the last ones are steadier at low refresh rates
+            render_budget (float): caps the fraction of a CPU core spent rendering, by lowering
+                the fps as the frames get more expensive, `0` for unlimited
             ctrl_c (bool): if False, disables CTRL+C (captures it)
+            threads (bool): if True, `bar()` can be called concurrently by several threads, each
+                one counting in its own slot, which are summed up on each refresh
+            processes (int): the number of shared memory counters to create, one for each
+                worker process, which are available in `bar.shared` (0 disables them)
+            perf (bool): counts the `bar()` calls too, in addition to the rendering counters of
+                `bar.perf`, and appends them all to the final receipt
+            renderer (str): how the bar is refreshed: 'thread', 'asyncio' or 'pull'
+                the 'asyncio' one runs as callbacks in the running event loop, without threads
+                the 'pull' one has no threads either, the host calls `bar.tick(now)` to render
+                a frame when due, or `bar.render()` to render one right away, and as the host
+                owns the terminal, the prints are not hooked, so several can run concurrently
+            json_secs (float): when there's no tty, writes a compact JSON line with the bar
+                status every these seconds, instead of nothing until the receipt (0 disables)
+            metrics (Union[None, int, str]): exports the bar status in the OpenMetrics format,
+                served on this local HTTP port or 'host:port', or written to this file path
             dual_line (bool): if True, places the text below the bar
             unit (str): any text that labels your entities
             scale (any): the scaling to apply to units: 'SI', 'IEC', 'SI2'
@@ -118,15 +153,45 @@ def alive_bar(total: Optional[int] = None, *, calibrate: Optional[int] = None, *
     """
 
     try:
-        config = config_handler(**options)
+        config = config_handler(config=config, **options)
     except Exception as e:
         raise type(e)(str(e)) from None
     return __alive_bar(config, total, calibrate=calibrate)
 
 
-@contextmanager
+def _async_capable(func):
+    """Like `contextlib.contextmanager`, but the context managers also support `async with`."""
+    cm = contextmanager(func)
+
+    @wraps(func)
+    def helper(*args, **kwargs):
+        return _AsyncCapableContextManager(cm(*args, **kwargs))
+
+    return helper
+
+
+class _AsyncCapableContextManager:
+    """Support both `with` and `async with`, since entering and exiting a bar do not await."""
+
+    def __init__(self, cm):
+        self._cm = cm
+
+    def __enter__(self):
+        return self._cm.__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self._cm.__exit__(exc_type, exc_val, exc_tb)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return self.__exit__(exc_type, exc_val, exc_tb)
+
+
+@_async_capable
 def __alive_bar(config, total=None, *, calibrate=None,
-                _cond=threading.Condition, _sampling=False, _testing=None):
+                _cond=threading.Condition, _manager=None, _sampling=False, _testing=None):
     """Actual alive_bar handler, that exposes internal functions for configuration of
     both normal operation and sampling overhead."""
 
@@ -135,18 +200,83 @@ def __alive_bar(config, total=None, *, calibrate=None,
             raise TypeError(f"integer argument expected, got '{type(total).__name__}'.")
         if total <= 0:
             total = None
+    if config.manual and config.processes:
+        raise UserWarning("Manual mode can't be used with worker processes.")
 
     def run(spinner_player, spinner_suffix):
         with cond_refresh:
             while thread:
                 event_renderer.wait()
-                alive_repr(term, next(spinner_player), spinner_suffix)
-                cond_refresh.wait(1. / fps(run.rate))
+                hook_manager.drain()  # the captured prints go first, then the frame.
+                start = time.perf_counter()
+                alive_repr(term, next(spinner_player), spinner_suffix, diff=True)
+                fps.measure(start)
+                hook_manager.wait(1. / fps(run.rate))  # or until a print comes, or it ends.
+
+    def run_async(spinner_player, spinner_suffix):  # the 'asyncio' renderer, within the loop.
+        if not thread:
+            return
+        if event_renderer.is_set():
+            with acquire():
+                hook_manager.drain()
+                start = time.perf_counter()
+                alive_repr(term, next(spinner_player), spinner_suffix, diff=True)
+                fps.measure(start)
+        thread.schedule(1. / fps(run.rate))
+
+    def run_status():  # the json and metrics renderer, when there's nothing to animate.
+        with cond_refresh:
+            while thread:
+                event_renderer.wait()
+                remaining = run.next_status - time.perf_counter()
+                if remaining > 0.:  # prints also wake it up, but they must not trigger writes.
+                    cond_refresh.wait(remaining)
+                    continue
+                run.next_status = time.perf_counter() + status_secs
+                status_repr(term)
+
+    def run_status_async():
+        if not thread:
+            return
+        if event_renderer.is_set():
+            with cond_refresh:
+                status_repr(term)
+        thread.schedule(status_secs)
+
+    def render(write=True, *, diff=False):  # the 'pull' renderer, called by the host.
+        if not event_renderer.is_set() or not cond_refresh.acquire(blocking=False):
+            return None  # paused, or a print is being written: the host is never blocked.
+        try:
+            out, start = term if write and term.interactive else pull_term, time.perf_counter()
+            frame = alive_repr(out, next(spinner_player), spinner_suffix, diff=diff)
+            fps.measure(start)
+            return frame
+        finally:
+            cond_refresh.release()
+
+    def tick(now=None, write=True):
+        now = time.perf_counter() if now is None else now
+        if now < run.next_tick:
+            return None
+        if term.interactive:
+            run.next_tick = now + 1. / fps(run.rate)
+            return render(write, diff=True)  # None if the frame has not changed.
+        if config.json_secs or config.metrics:  # there's nothing to animate.
+            run.next_tick = now + status_secs
+            if event_renderer.is_set() and cond_refresh.acquire(blocking=False):
+                try:
+                    status_repr(term)
+                finally:
+                    cond_refresh.release()
+        return None
 
     run.rate, run.init, run.elapsed, run.percent = 0., 0., 0., 0.
-    run.count, run.processed, run.last_len = 0, 0, 0
-    run.text, run.title, run.suffix, ctrl_c = None, None, None, False
+    run.count, run.processed, run.last_len, run.last_sync, run.shared = 0, 0, 0, 0, 0
+    run.text, run.title, run.suffix, run.last_frame, ctrl_c = None, None, None, None, False
+    run.raw_text, run.raw_title, run.next_status, run.next_tick = None, None, 0., 0.
     run.monitor_text, run.eta_text, run.rate_text = '?', '?', '?'
+    run.frames, run.chars, run.calls, run.render_secs, run.max_render_secs, run.lock_wait = \
+        0, 0, 0, 0., 0., 0.
 
     if _testing:  # it's easier than trying to mock these internal values.
         run.elapsed = 1.23
@@ -156,34 +286,104 @@ def __alive_bar(config, total=None, *, calibrate=None,
     else:
         def main_update_hook():
             run.elapsed = time.perf_counter() - run.init
-            run.rate = gen_rate.send((processed(), run.elapsed))
-
-    def alive_repr(out, spinner=None, spinner_suffix=None):
+            run.rate = rate_estimator.update(processed(), run.elapsed)
+
+    def acquire():  # only measures the time waited when someone else is holding the lock.
+        if not cond_refresh.acquire(blocking=False):
+            start = time.perf_counter()
+            cond_refresh.acquire()
+            run.lock_wait += time.perf_counter() - start
+        return locked
+
+    def alive_repr(out, spinner=None, spinner_suffix=None, *, diff=False):
+        start = time.perf_counter()
+        sync_update_hook()
         main_update_hook()
-
+        export()
+        line = frame_repr(out, spinner, spinner_suffix, diff)
+        if line is None:
+            return None
+
+        cost = time.perf_counter() - start
+        run.frames, run.chars = run.frames + 1, run.chars + len(line)
+        run.render_secs += cost
+        run.max_render_secs = max(run.max_render_secs, cost)
+        return line
+
+    def frame_repr(out, spinner, spinner_suffix, diff):
         fragments = (run.title, bar_repr(run.percent), bar_suffix, spinner, spinner_suffix,
                      monitor(), elapsed(), stats(), *run.text)
+        cols = out.cols()
+
+        if diff:  # skips the frame if it would be exactly the same as the one on screen.
+            if not hook_manager.printed and run.last_frame == (cols, fragments):
+                return None
+            run.last_frame, hook_manager.printed = (cols, fragments), False
+
+        line, run.last_len = render_cells(fragments, cols, out, run.last_len)
+        line += run.suffix
+        out.write(line)  # the whole frame in only one write.
+        out.flush()
+        return line
+
+    def status_repr(out):
+        sync_update_hook()
+        main_update_hook()
+        export()
+        if not config.json_secs:  # only the metrics.
+            return
 
-        run.last_len = print_cells(fragments, out.cols(), out, run.last_len)
-        out.write(run.suffix)
+        eta = eta_secs()
+        status = dict(title=run.raw_title, text=run.raw_text, count=current_count(), total=total,
+                      percent=round(run.percent, 4), rate=round(run.rate, 2),
+                      eta=None if eta is None else round(eta, 1), elapsed=round(run.elapsed, 1))
+        out.write(dumps(status, ensure_ascii=False, separators=(',', ':')) + '\n')
         out.flush()
 
     def set_text(text=None):
+        run.raw_text = None if text is None else str(text)
         if text and config.dual_line:
             run.text, run.suffix = ('\n', to_cells(str(text))), term.cursor_up_1.sequence
         else:
             run.text, run.suffix = (to_cells(None if text is None else str(text)),), ''  # 1-tuple.
 
     def set_title(title=None):
+        run.raw_title = config.title if title is None else str(title)
         run.title = _render_title(config, None if title is None else str(title))
         if run.title:
-            run.title += (' ',)  # space separator for print_cells.
+            run.title = Rendered(run.title + (' ',))  # space separator for print_cells.
 
     if config.manual:
         def bar(percent):  # for manual mode (with total or not).
             hook_manager.flush_buffers()  # notify that the current index is about to change.
             run.percent = max(0., float(percent))  # absolute value can't be negative.
             bar_update_hook()
+    elif config.threads and not total:
+        def bar(count=1):  # for unknown mode, striped: each thread only writes to its own slot.
+            try:
+                slot = local.slot
+            except AttributeError:
+                slot = local.slot = [0, 0]
+                slots.append(slot)
+            slot[0] += count
+    elif config.threads:
+        def bar(count=1, *, skipped=False):  # for definite mode, striped: the same.
+            try:
+                slot = local.slot
+            except AttributeError:
+                slot = local.slot = [0, 0]
+                slots.append(slot)
+            slot[0] += count
+            if not skipped:
+                slot[1] += count
+    elif config.fast and not total:
+        def bar(count=1):  # for unknown mode, fast path: everything else is deferred.
+            run.count += count
+    elif config.fast:
+        def bar(count=1, *, skipped=False):  # for definite mode, fast path: the same.
+            run.count += count
+            if not skipped:
+                run.processed += count
     elif not total:
         def bar(count=1):  # for unknown mode, i.e. not manual and not total.
             hook_manager.flush_buffers()  # notify that the current index is about to change.
@@ -201,21 +401,86 @@ def __alive_bar(config, total=None, *, calibrate=None,
                 run.processed = max(0, run.processed)  # but absolute value can't.
             bar_update_hook()
 
+    if config.threads and not config.manual:
+        def deferred_update_hook():  # aggregates the striped counters, run on each refresh.
+            count = processed = 0
+            for c, p in tuple(slots):
+                count += c
+                processed += p
+            if count != run.count:
+                hook_manager.flush_buffers()  # the current index has changed.
+                run.count, run.processed = max(0, count), max(0, processed)
+                bar_update_hook()
+
+        def local_count():  # there may be no refresh thread, so they are summed on read too.
+            return max(0, sum(c for c, _ in tuple(slots)))
+
+        local, slots = threading.local(), []
+    elif config.fast and not config.manual:
+        def deferred_update_hook():  # the deferred part of the fast path, run on each refresh.
+            if run.count != run.last_sync:
+                hook_manager.flush_buffers()  # the current index has changed.
+                # only write when needed, bar() may be running concurrently.
+                if run.count < 0 or run.processed < 0:
+                    run.count, run.processed = max(0, run.count), max(0, run.processed)
+                run.last_sync = run.count
+                bar_update_hook()
+    else:
+        deferred_update_hook = _noop
+
+    if not config.threads or config.manual:
+        def local_count():
+            return run.count
+
+    def synced_shared_count():
+        return run.shared
+
+    if config.processes:
+        def shared_count():  # read on demand too, like the striped counters.
+            return shared.total()
+
+        def sync_update_hook():  # collects what the worker processes have done since last time.
+            count = shared.total()
+            if count != run.shared:  # kept apart, only the bar() caller ever writes run.count.
+                hook_manager.flush_buffers()  # the current index has changed.
+                run.shared = count
+                bar_update_hook()
+            deferred_update_hook()
+    else:
+        sync_update_hook, shared_count = deferred_update_hook, synced_shared_count
+
+    if config.perf:  # bar() must be as cheap as possible, so its calls are counted on demand.
+        def counted_bar(*args, **kwargs):
+            run.calls += 1
+            bar(*args, **kwargs)
+    else:
+        counted_bar = bar
+
+    def get_perf():
+        flushes = _manager.flushes() if _manager else run.frames + hook_manager.flushes
+        return Perf(run.frames, run.render_secs, run.max_render_secs, run.chars, flushes,
+                    run.calls if config.perf else None, hook_manager.writes(),
+                    run.lock_wait + hook_manager.lock_wait)
+
     def start_monitoring(offset=0.):
+        term.watch_resize()
         term.hide_cursor()
         hook_manager.install()
-        bar_handle._handle = bar
-        run.init = time.perf_counter() - offset
+        bar_handle._handle = counted_bar
+        run.init, run.last_frame = time.perf_counter() - offset, None
         event_renderer.set()
 
     def stop_monitoring():
         term.show_cursor()
+        term.unwatch_resize()
         hook_manager.uninstall()
         bar_handle._handle = None
         return time.perf_counter() - run.init
 
     @contextmanager
     def pause_monitoring():
+        if _manager:
+            raise UserWarning("Pause can't be used within a multi bar.")
         event_renderer.clear()
         offset = stop_monitoring()
         alive_repr(term)
@@ -226,31 +491,82 @@ def __alive_bar(config, total=None, *, calibrate=None,
         finally:
             start_monitoring(offset)
 
+    def current_count():  # the workers' total is kept apart, see sync_update_hook.
+        return local_count() + shared_count()
+
     if total or not config.manual:  # we can count items.
-        logic_total, current = total, lambda: run.count
+        logic_total, current = total, current_count
         unit, factor, header = config.unit, 1.e6, 'on {:d}: '
     else:  # there's only a manual percentage.
         logic_total, current = 1., lambda: run.percent
         unit, factor, header = f'%{config.unit}', 1., 'on {:.1%}: '
-    processed = (lambda: run.processed) if total and not config.manual else current
+    processed = (lambda: run.processed + run.shared) if total and not config.manual else current
 
-    thread, event_renderer, cond_refresh = None, threading.Event(), _cond()
+    thread, event_renderer = None, threading.Event()
+    cond_refresh = _manager.cond if _manager else _cond()
+    locked = Locked(cond_refresh)
     bar_repr, bar_suffix = _create_bars(config)
-    fps = (custom_fps(config.refresh_secs) if config.refresh_secs
-           else calibrated_fps(calibrate or factor))
-    gen_rate = gen_simple_exponential_smoothing(.3, lambda pos, elapse: pos / elapse)
-    gen_rate.send(None)
+    if _manager:  # the multi bar refreshes all of them, so it governs the fps.
+        fps = _manager.fps
+    else:
+        fps = budgeted_fps(custom_fps(config.refresh_secs) if config.refresh_secs
+                           else calibrated_fps(calibrate or factor), config.render_budget)
+    rate_estimator, eta_estimator = create_estimators(config.estimator, logic_total)
 
     if config.disable:
         term, hook_manager = terminal.get_void(), passthrough_hook_manager()
+    elif _manager:  # the multi bar owns the terminal, the hooks and the refresh thread.
+        if config.renderer == 'pull':
+            raise UserWarning("The 'pull' renderer can't be used within a multi bar.")
+        term, hook_manager = _manager.term, passthrough_hook_manager()
+    elif config.renderer == 'pull':  # the host owns the terminal, so the prints are not hooked.
+        term = terminal.get_term(config.file, config.force_tty, config.max_cols)
+        hook_manager = passthrough_hook_manager()
     else:
         term = terminal.get_term(config.file, config.force_tty, config.max_cols)
         hook_manager = buffered_hook_manager(header if config.enrich_print else '',
                                              current, config.enrich_offset, cond_refresh, term)
 
-    if term.interactive:
-        thread = threading.Thread(target=run, args=_create_spinner_player(config))
-        thread.daemon = True
+    status_secs = config.json_secs or EXPORT_SECS
+    if config.json_secs:
+        from json import dumps  # must not be on top.
+
+    if config.metrics and not config.disable:
+        def export():  # driven by the renderers, so bar() pays nothing for it.
+            exporter.update(key, (run.raw_title, current_count(), total, run.rate, eta_secs(),
+                                  run.elapsed))
+
+        exporter, key = get_exporter(config.metrics), next_key()
+    else:
+        export, exporter = _noop, None
+
+    if config.processes:  # before any renderer starts, as they read it.
+        from .counters import SharedCounters  # must not be on top.
+        shared = SharedCounters(config.processes)
+    else:
+        shared = None
+
+    if _manager and not config.disable:
+        thread = _manager.attach(event_renderer, alive_repr, _create_spinner_player(config),
+                                 lambda: run.rate)
+    elif config.renderer == 'pull':  # the host renders it, via bar.render() or bar.tick().
+        spinner_player, spinner_suffix = _create_spinner_player(config)
+        pull_term = SimpleNamespace(**{**vars(term), 'write': _noop, 'flush': _noop})
+    elif term.interactive:
+        hook_manager.deferred = True  # the prints are emitted by the renderer, without the lock.
+        if config.renderer == 'asyncio':
+            thread = _AsyncRenderer(run_async, _create_spinner_player(config))
+            hook_manager.wake = thread.wake  # there's no thread waiting on the condition.
+        else:
+            thread = threading.Thread(target=run, args=_create_spinner_player(config))
+            thread.daemon = True
+        thread.start()
+    elif (config.json_secs or config.metrics) and not config.disable:
+        if config.renderer == 'asyncio':
+            thread = _AsyncRenderer(run_status_async, ())
+        else:
+            thread = threading.Thread(target=run_status)
+            thread.daemon = True
         thread.start()
 
     if not config.scale:
@@ -259,6 +575,9 @@ def __alive_bar(config, total=None, *, calibrate=None,
 
         def rate_text(precision):
             return f'{run.rate:.{precision}f}{unit}/s'
+
+        def rate_inputs():  # the rate at display precision.
+            return round(run.rate, 1)
     else:
         import about_time  # must not be on top.
         d1024, iec = {
@@ -275,37 +594,50 @@ def __alive_bar(config, total=None, *, calibrate=None,
         def rate_text(precision):
             return fn_human_throughput(run.rate, unit, precision)
 
+        def rate_inputs():  # enough digits for any scaled display, way cheaper than scaling.
+            return float(f'{run.rate:.5g}')
+
     def monitor_run(f, precision=config.precision):
-        run.monitor_text = human_count(run.count, precision)
-        return f.format(count=run.monitor_text, total=total_human, percent=run.percent)
+        run.monitor_text = human_count(current_count(), precision)
+        return f(count=run.monitor_text, total=total_human, percent=run.percent)
 
     def monitor_end(f):
         warning = '(!) ' if total is not None and current() != logic_total else ''
         return f'{warning}{monitor_run(f, None)}'
 
     def elapsed_run(f):
-        return f.format(elapsed=time_display(run.elapsed, RUN))
+        return f(elapsed=time_display(run.elapsed, RUN))
 
     def elapsed_end(f):
-        return f.format(elapsed=time_display(run.elapsed, END))
+        return f(elapsed=time_display(run.elapsed, END))
 
     def stats_end(f):
         run.rate_text = rate_text(2)
-        return f.format(rate=run.rate_text, unit=unit)
+        return f(rate=run.rate_text, unit=unit)
 
     if total or config.manual:  # we can track progress and therefore eta.
+        def stats_inputs():  # the estimator must be updated on every frame, though.
+            run.eta = eta_estimator.update(current(), run.rate)
+            return rate_inputs(), round(run.eta) if run.eta >= 0. else -1  # the eta in secs.
+
         def stats_run(f):
             run.rate_text = rate_text(1)  # although repeated below,
-            run.eta_text = eta_text(gen_eta.send((current(), run.rate)))
-            return f.format(rate=run.rate_text, unit=unit, eta=run.eta_text)
+            run.eta_text = eta_text(run.eta)
+            return f(rate=run.rate_text, unit=unit, eta=run.eta_text)
+
+        def eta_secs():  # the rate is already smoothed, and this must not touch the estimator.
+            return max(0., (logic_total - current()) / run.rate) if run.rate else None
 
-        gen_eta = gen_simple_exponential_smoothing(.5, fn_simple_eta(logic_total))
-        gen_eta.send(None)
         stats_default = '({eta}, {rate})'
     else:  # unknown progress.
+        stats_inputs = rate_inputs
+
         def stats_run(f):
             run.rate_text = rate_text(1)  # it won't be calculated if not needed.
-            return f.format(rate=run.rate_text, eta='?')
+            return f(rate=run.rate_text, eta='?')
+
+        def eta_secs():
+            return None
 
         bar_repr = bar_repr.unknown
         stats_default = '({rate})'
@@ -320,7 +652,7 @@ def __alive_bar(config, total=None, *, calibrate=None,
             monitor_default = '{count}/{total} [{percent:.0%}]'
 
             def bar_update_hook():
-                run.percent = run.count / total
+                run.percent = (run.count + run.shared) / total
     else:
         def bar_update_hook():
             pass
@@ -332,23 +664,32 @@ def __alive_bar(config, total=None, *, calibrate=None,
 
     total_human = human_count(total or 0)  # avoid converting it on all refreshes.
 
-    monitor = _Widget(monitor_run, config.monitor, monitor_default)
+    # the widgets are only formatted again when their inputs change at display precision.
+    monitor = _Widget(monitor_run, config.monitor, monitor_default,
+                      lambda: (run.count, run.shared, run.percent))
     monitor_end = _Widget(monitor_end, config.monitor_end, monitor.f[:-1])  # space separator.
-    elapsed = _Widget(elapsed_run, config.elapsed, 'in {elapsed}')
+    elapsed = _Widget(elapsed_run, config.elapsed, 'in {elapsed}', lambda: round(run.elapsed))
     elapsed_end = _Widget(elapsed_end, config.elapsed_end, elapsed.f[:-1])  # space separator.
-    stats = _Widget(stats_run, config.stats, stats_default)
+    stats = _Widget(stats_run, config.stats, stats_default, stats_inputs)
     stats_end = _Widget(stats_end, config.stats_end, '({rate})' if stats.f[:-1] else '')
 
     def get_receipt():
         buffer = io.StringIO()
         tbuf = terminal.get_term(buffer, True, 1000)  # large enough to not truncate.
         run.last_len = 0  # prevents the inclusion of the clear end line escape sequence.
-        alive_repr(tbuf)
+        sync_update_hook()
+        main_update_hook()
+        frame_repr(tbuf, None, None, False)  # neither exported nor counted, it is not a frame.
         return buffer.getvalue().strip()
 
+    if config.renderer != 'pull' or _manager:
+        render = tick = _pull_only
     bar_handle = __AliveBarHandle(pause_monitoring, set_title, set_text,
                                   current, lambda: run.monitor_text, lambda: run.rate_text,
-                                  lambda: run.eta_text, lambda: run.elapsed, get_receipt)
+                                  lambda: run.eta_text, lambda: run.elapsed, get_receipt,
+                                  lambda: shared, render, tick, fps.achieved, fps.load,
+                                  get_perf)
+
     set_text(), set_title()
     start_monitoring()
     try:
@@ -361,29 +702,183 @@ def __alive_bar(config, total=None, *, calibrate=None,
         stop_monitoring()
         if thread:  # lets the internal thread terminate gracefully.
             local_copy, thread = thread, None
+            with cond_refresh:
+                cond_refresh.notify()  # without waiting for the current refresh period.
+            hook_manager.wake()
             local_copy.join()
+        with acquire():  # other bars within a multi bar may be refreshing concurrently.
+            sync_update_hook()  # even without a receipt, the final count must be up-to-date.
+
+            # guarantees last_len is already set...
+            if ctrl_c and term.cols() - run.last_len < 2:
+                term.cursor_up_1()  # try to not duplicate last line when terminal prints "^C".
+
+            if config.receipt:  # prints the nice but optional final receipt.
+                elapsed, stats, monitor = elapsed_end, stats_end, monitor_end
+                bar_repr, run.suffix = bar_repr.end, ''
+                if not config.receipt_text:
+                    set_text()
+                term.clear_end_screen()
+                alive_repr(term)
+                term.write('\n')
+                if config.perf:
+                    term.write(f'{_render_perf(get_perf())}\n')
+            else:
+                term.clear_line()
+            main_update_hook = _noop  # freeze the final elapsed, rate and eta values.
+            term.flush()
+            if exporter:  # only the active bars are exported.
+                exporter.remove(key)
+                export = _noop  # the receipt may still be rendered later.
+        if shared:
+            # freeze the final count.
+            sync_update_hook, shared_count = deferred_update_hook, synced_shared_count
+            shared.close()
+
+
+def alive_multibar(*, calibrate: Optional[int] = None, config: Optional[Config] = None,
+                   **options: Any):
+    """A manager of several alive progress bars, stacked and refreshed together.
+    It owns the terminal, the print and logging hooks, and a single refresh thread, so any
+    number of concurrent bars cost only one thread and one flush per frame.
 
-        # guarantees last_len is already set...
-        if ctrl_c and term.cols() - run.last_len < 2:
-            term.cursor_up_1()  # try to not duplicate last line when terminal prints "^C".
-
-        if config.receipt:  # prints the nice but optional final receipt.
-            elapsed, stats, monitor = elapsed_end, stats_end, monitor_end
-            bar_repr, run.suffix = bar_repr.end, ''
-            if not config.receipt_text:
-                set_text()
-            term.clear_end_screen()
-            alive_repr(term)
-            term.write('\n')
-        else:
-            term.clear_line()
-        main_update_hook = _noop  # freeze the final elapsed, rate and eta values.
+    Use it like this:
+
+    >>> from alive_progress import alive_multibar
+    ... with alive_multibar(title_length=12) as multi:
+    ...     def download(url, size):
+    ...         with multi.bar(size, title=url) as bar:
+    ...             for chunk in <chunks>:
+    ...                 bar(len(chunk))
+    ...     with ThreadPoolExecutor() as executor:
+    ...         for url, size in <downloads>:
+    ...             executor.submit(download, url, size)
+
+    Each `multi.bar()` accepts the same arguments as `alive_bar`, and returns a context manager
+    that works just like it. When a bar finishes, its receipt is printed above the others,
+    which keep refreshing below. Pausing is not supported, and `dual_line` is ignored.
+
+    Args:
+        calibrate (float): maximum theoretical throughput to calibrate animation speed
+        config (Optional[Config]): a profile to be used instead of the global configuration,
+            which is also inherited by all the bars
+        **options: custom configuration options, which override the global configuration,
+            and are inherited by all the bars. The terminal ones, like `file`, `force_tty`,
+            `max_cols`, and `refresh_secs` only apply to the multi bar. Prints are never
+            enriched within it, as there's no single bar position to show.
+
+    """
+    try:
+        profile, config = config, config_handler(config=config, **options)
+    except Exception as e:
+        raise type(e)(str(e)) from None
+    return __alive_multibar(config, profile, options, calibrate=calibrate)
+
+
+@_async_capable
+def __alive_multibar(config, profile, options, *, calibrate=None):
+    """Actual alive_multibar handler, which renders all the attached bars."""
+
+    def run():
+        with cond_refresh:
+            while thread:
+                live = [entry for entry in bars if entry[0].is_set()]
+                hook_manager.drain()  # the captured prints go first, then the frames.
+                if live:
+                    start = time.perf_counter()
+                    render(live)
+                    fps.measure(start)
+                hook_manager.wait(1. / fps(max(entry[3]() for entry in live) if live else 0.))
+
+    def render(live):
+        for i, (_, alive_repr, (spinner_player, spinner_suffix), _) in enumerate(live):
+            if i:
+                parts.append('\n')
+            alive_repr(frame, next(spinner_player), spinner_suffix)
+        if len(live) > 1:
+            parts.append(term.factory_cursor_up(len(live) - 1).sequence)
+        parts.append(term.carriage_return)  # the cursor always rests on the first bar.
+        term.write(''.join(parts))  # all the bars in only one write and flush.
+        term.flush()
+        render.flushes += 1
+        parts.clear()
+
+    def flushes():  # one flush serves all the bars, so they all report the same ones.
+        return render.flushes + hook_manager.flushes
+
+    def attach(event_renderer, alive_repr, spinner, get_rate):
+        def detach():  # a stand-in for the bar's refresh thread.
+            with cond_refresh:
+                bars.remove(entry)
+
+        entry = event_renderer, alive_repr, spinner, get_rate
+        with cond_refresh:
+            bars.append(entry)
+        return SimpleNamespace(join=detach)
+
+    def new_bar(total=None, *, calibrate=None, config=None, **bar_options):
+        try:
+            if config is None:  # inherits the multi bar configuration.
+                config, bar_options = profile, {**options, **bar_options}
+            bar_config = config_handler(config=config, **bar_options)
+        except Exception as e:
+            raise type(e)(str(e)) from None
+        return __alive_bar(bar_config._replace(dual_line=False), total, calibrate=calibrate,
+                           _manager=manager)
+
+    if config.renderer == 'pull':
+        raise UserWarning("The 'pull' renderer can't be used within a multi bar.")
+
+    bars, thread, cond_refresh, render.flushes = [], None, threading.Condition(), 0
+    fps = budgeted_fps(custom_fps(config.refresh_secs) if config.refresh_secs
+                       else calibrated_fps(calibrate or 1.e6), config.render_budget)
+
+    if config.disable:
+        term, hook_manager = terminal.get_void(), passthrough_hook_manager()
+    else:
+        term = terminal.get_term(config.file, config.force_tty, config.max_cols)
+        hook_manager = buffered_hook_manager('', None, 0, cond_refresh, term)
+
+    # the bars must not touch the cursor nor the resize handler, and since it always rests on
+    # the first bar, clearing their line means clearing all of them, redrawn on the next frame.
+    bar_term = SimpleNamespace(**{**vars(term), 'hide_cursor': _noop, 'show_cursor': _noop,
+                                  'watch_resize': _noop, 'unwatch_resize': _noop,
+                                  'clear_line': term.clear_end_screen})
+    parts = []  # the frame is assembled here, then written at once.
+    frame = SimpleNamespace(**{**vars(bar_term), 'write': parts.append, 'flush': _noop})
+    manager = SimpleNamespace(term=bar_term, cond=cond_refresh, attach=attach, fps=fps,
+                              flushes=flushes)
+
+    if term.interactive:
+        hook_manager.deferred = True  # the prints are emitted by the renderer, without the lock.
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
+
+    term.watch_resize()
+    term.hide_cursor()
+    hook_manager.install()
+    try:
+        yield SimpleNamespace(bar=new_bar)
+    finally:
+        term.show_cursor()
+        term.unwatch_resize()
+        hook_manager.uninstall()
+        if thread:  # lets the internal thread terminate gracefully.
+            local_copy, thread = thread, None
+            with cond_refresh:
+                cond_refresh.notify()  # without waiting for the current refresh period.
+            hook_manager.wake()
+            local_copy.join()
+        term.clear_end_screen()  # erases any bars that are still running.
         term.flush()
 
 
 class _Widget:  # pragma: no cover
-    def __init__(self, func, value, default):
-        self.func = func
+    __slots__ = ('f', 'format', 'func', 'inputs', 'last', 'text')
+
+    def __init__(self, func, value, default, inputs=None):
+        self.func, self.inputs, self.last, self.text = func, inputs, _Widget, None
         if isinstance(value, str):
             self.f = value
         elif value:
@@ -393,9 +888,27 @@ class _Widget:  # pragma: no cover
 
         if self.f:
             self.f += ' '  # space separator for print_cells.
+        self.format = self.f.format  # bound only once, instead of on every frame.
 
     def __call__(self):
-        return self.func(self.f)
+        if self.inputs is None:
+            return self.func(self.format)
+        inputs = self.inputs()
+        if inputs != self.last:  # the widget itself is the sentinel, no inputs are equal to it.
+            self.last, self.text = inputs, self.func(self.format)
+        return self.text
+
+
+Perf = namedtuple('Perf', 'frames render_secs max_render_secs chars flushes calls hook_writes '
+                          'lock_wait_secs')
+
+
+def _render_perf(perf):
+    calls = '' if perf.calls is None else f', {perf.calls} calls'
+    return (f'perf: {perf.frames} frames in {perf.render_secs * 1e3:.1f}ms '
+            f'(max {perf.max_render_secs * 1e3:.2f}ms), {perf.chars} chars, '
+            f'{perf.flushes} flushes{calls}, {perf.hook_writes} hook writes, '
+            f'{perf.lock_wait_secs * 1e3:.1f}ms lock wait')
 
 
 class _ReadOnlyProperty:  # pragma: no cover
@@ -444,13 +957,22 @@ class __AliveBarHandle:
     eta = _ReadOnlyProperty()
     elapsed = _ReadOnlyProperty()
     receipt = _Function()
+    shared = _ReadOnlyProperty()
+    render = _GatedFunction()
+    tick = _GatedFunction()
+    fps = _ReadOnlyProperty()
+    load = _ReadOnlyProperty()
+    perf = _ReadOnlyProperty()
 
     def __init__(self, pause, set_title, set_text, get_current, get_monitor, get_rate, get_eta,
-                 get_elapsed, get_receipt):
+                 get_elapsed, get_receipt, get_shared, render, tick, get_fps, get_load,
+                 get_perf):
         self._handle, self._pause, self._current = None, pause, get_current
         self._title, self._text = set_title, set_text
         self._monitor, self._rate, self._eta = get_monitor, get_rate, get_eta
-        self._elapsed, self._receipt = get_elapsed, get_receipt
+        self._elapsed, self._receipt, self._shared = get_elapsed, get_receipt, get_shared
+        self._render, self._tick = render, tick
+        self._fps, self._load, self._perf = get_fps, get_load, get_perf
 
     # support for disabling the bar() implementation.
     def __call__(self, *args, **kwargs):
@@ -462,6 +984,49 @@ def _noop(*_args, **_kwargs):  # pragma: no cover
     pass
 
 
+def _pull_only(*_args, **_kwargs):  # pragma: no cover
+    raise UserWarning("The bar can only be rendered by hand with the 'pull' renderer.")
+
+
+class _AsyncRenderer:  # pragma: no cover
+    """A stand-in for the refresh thread, which runs the renderer as callbacks in the
+    running event loop instead, so it never competes with it for the GIL."""
+
+    def __init__(self, target, args):
+        import asyncio  # must not be on top.
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise UserWarning("The 'asyncio' renderer needs a running event loop, "
+                              'use it within an `async with` or `async for`.') from None
+        self._target, self._args = target, args
+        self._handle, self._waking = None, False
+
+    def start(self):
+        self._handle = self._loop.call_soon(self._target, *self._args)
+
+    def schedule(self, delay):
+        self._handle = self._loop.call_later(delay, self._target, *self._args)
+
+    def wake(self):
+        """Render right away instead of on the next refresh, callable from any thread."""
+        # the flag is not locked, but a race is benign: two threads seeing it unset only
+        # schedule one extra frame, and seeing it set means the write was already queued,
+        # before the frame that _wake reschedules after clearing it.
+        if not self._waking:  # a print makes several writes, only the first wakes it up.
+            self._waking = True
+            self._loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        self._waking = False
+        if not self._handle.cancelled():  # it hasn't been stopped.
+            self._handle.cancel()
+            self.start()
+
+    def join(self):
+        self._handle.cancel()
+
+
 def _create_bars(config):
     bar = config.bar
     if bar is None:
@@ -503,10 +1068,28 @@ def _render_title(config, title=None):
 
 T = TypeVar('T')
 
+AUTO_CHUNK_SECS = .005  # the target period to advance the bar in the auto chunk mode.
+
+
+@overload
+def alive_it(it: Iterable[T], total: Optional[int] = None, *,
+             finalize: Optional[Callable[[Any], None]] = None,
+             chunk: Union[int, str, None] = None, calibrate: Optional[int] = None,
+             config: Optional[Config] = None, **options: Any) -> Iterable[T]: ...
+
+
+@overload
+def alive_it(it: AsyncIterable[T], total: Optional[int] = None, *,
+             finalize: Optional[Callable[[Any], None]] = None,
+             chunk: Union[int, str, None] = None, calibrate: Optional[int] = None,
+             config: Optional[Config] = None, **options: Any) -> AsyncIterable[T]: ...
 
-def alive_it(it: Collection[T], total: Optional[int] = None, *,
-             finalize: Callable[[Any], None] = None,
-             calibrate: Optional[int] = None, **options: Any) -> Iterable[T]:
+
+def alive_it(it: Union[Iterable[T], AsyncIterable[T]], total: Optional[int] = None, *,
+             finalize: Optional[Callable[[Any], None]] = None,
+             chunk: Union[int, str, None] = None, calibrate: Optional[int] = None,
+             config: Optional[Config] = None,
+             **options: Any) -> Union[Iterable[T], AsyncIterable[T]]:
     """New iterator adapter in 2.0, which makes it simpler to monitor any processing.
 
     Simply wrap your iterable with `alive_it`, and process your items normally!
@@ -550,11 +1133,31 @@ def alive_it(it: Collection[T], total: Optional[int] = None, *,
     This prints:
 DB updated |████████████████████| 100k/100k [100%] in 2.6s (38.7k/s) 100000 entries changed
 
+    For very tight loops over lots of small items, you can send a `chunk` to count the items
+    locally, and advance the bar only once per chunk. Send 'auto' to let it tune the chunk size
+    by itself, advancing the bar every few milliseconds. The remaining items are always counted
+    when the iteration ends, even by an exception. Just note that the bar position, which also
+    enriches print() and logging messages, will lag behind by up to one chunk.
+
+    >>> from alive_progress import alive_it
+    ...
+    ... for item in alive_it(range(10_000_000), chunk='auto'):
+    ...     # process item.
+
+    Async iterables are supported as well, just use `async for` instead!
+
+    >>> from alive_progress import alive_it
+    ...
+    ... async for item in alive_it(aiter, renderer='asyncio'):
+    ...     # process item.
+
     Args:
         it: the input iterable to be processed
         total: same as alive_bar
         finalize: a function to be called when the bar is going to finalize
+        chunk: the number of items to count before advancing the bar, or 'auto'
         calibrate: same as alive_bar
+        config: same as alive_bar
         options: same as alive_bar
 
     See Also:
@@ -565,23 +1168,32 @@ DB updated |████████████████████| 100k/1
 
     """
     try:
-        config = config_handler(**options)
+        config = config_handler(config=config, **options)
     except Exception as e:
         raise type(e)(str(e)) from None
     if config.manual:
         raise UserWarning("Manual mode can't be used in iterator adapter.")
+    if chunk is not None and chunk != 'auto':
+        if not isinstance(chunk, int):
+            raise TypeError(f"integer argument expected, got '{type(chunk).__name__}'.")
+        if chunk <= 1:
+            chunk = None
 
     if total is None and hasattr(it, '__len__'):
         total = len(it)
-    it = iter(it)
-    if total is None and hasattr(it, '__length_hint__'):
-        total = it.__length_hint__()
-    return __AliveBarIteratorAdapter(it, finalize, __alive_bar(config, total, calibrate=calibrate))
+    if hasattr(it, '__aiter__'):
+        it = it.__aiter__()
+    else:
+        it = iter(it)
+        if total is None and hasattr(it, '__length_hint__'):
+            total = it.__length_hint__()
+    return __AliveBarIteratorAdapter(it, finalize, __alive_bar(config, total, calibrate=calibrate),
+                                     chunk)
 
 
-class __AliveBarIteratorAdapter(Iterable[T]):
-    def __init__(self, it, finalize, inner_bar):
-        self._it, self._finalize, self._inner_bar = it, finalize, inner_bar
+class __AliveBarIteratorAdapter(Iterable[T], AsyncIterable[T]):
+    def __init__(self, it, finalize, inner_bar, chunk=None):
+        self._it, self._finalize, self._inner_bar, self._chunk = it, finalize, inner_bar, chunk
 
     def __iter__(self):
         if '_bar' in self.__dict__:  # this iterator has already initiated.
@@ -589,9 +1201,32 @@ class __AliveBarIteratorAdapter(Iterable[T]):
 
         with self._inner_bar as self._bar:
             del self._inner_bar
-            for item in self._it:
-                yield item
-                self._bar()
+            if self._chunk:
+                yield from _chunked(self._it, self._bar, self._chunk)
+            else:
+                for item in self._it:
+                    yield item
+                    self._bar()
+            if self._finalize:
+                self._finalize(self._bar)
+
+    async def __aiter__(self):
+        if '_bar' in self.__dict__:  # this iterator has already initiated.
+            return
+
+        with self._inner_bar as self._bar:
+            del self._inner_bar
+            if self._chunk:
+                chunks = _achunked(self._it, self._bar, self._chunk)
+                try:
+                    async for item in chunks:
+                        yield item
+                finally:  # async generators are not closed on break, only later by the loop.
+                    await chunks.aclose()  # so the pending items are counted before the bar ends.
+            else:
+                async for item in self._it:
+                    yield item
+                    self._bar()
             if self._finalize:
                 self._finalize(self._bar)
 
@@ -609,3 +1244,48 @@ class __AliveBarIteratorAdapter(Iterable[T]):
         if '_bar' in self.__dict__:
             return setattr(self._bar, key, value)
         return super().__setattr__(key, value)
+
+
+def _chunked(it, bar, chunk):
+    """Iterate over `it`, counting the items locally and advancing the bar once per chunk."""
+    auto, size, pending = chunk == 'auto', 1 if chunk == 'auto' else chunk, 0
+    start = time.perf_counter()
+    try:
+        for item in it:
+            yield item
+            pending += 1  # only counted after the item was successfully processed.
+            if pending >= size:
+                bar(pending)
+                pending = 0
+                if auto:
+                    size, start = _tune_chunk(size, start)
+    finally:  # also on exceptions and early breaks, which close this generator.
+        if pending:
+            bar(pending)
+
+
+async def _achunked(it, bar, chunk):
+    """The same as `_chunked`, but for async iterables."""
+    auto, size, pending = chunk == 'auto', 1 if chunk == 'auto' else chunk, 0
+    start = time.perf_counter()
+    try:
+        async for item in it:
+            yield item
+            pending += 1
+            if pending >= size:
+                bar(pending)
+                pending = 0
+                if auto:
+                    size, start = _tune_chunk(size, start)
+    finally:
+        if pending:
+            bar(pending)
+
+
+def _tune_chunk(size, start):
+    """Tune the next chunk size, so the bar is advanced about every `AUTO_CHUNK_SECS`."""
+    now = time.perf_counter()
+    elapsed = now - start
+    if elapsed <= 0.:
+        return size * 2, now
+    return max(1, min(size * 2, int(size * AUTO_CHUNK_SECS / elapsed))), now
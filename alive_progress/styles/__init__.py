@@ -1,10 +1,19 @@
-from .exhibit import Show, show_bars, show_spinners, show_themes, showtime
 from .internal import BARS, SPINNERS, THEMES
 
 __all__ = (
     'BARS', 'SPINNERS', 'THEMES', 'Show', 'showtime', 'show_spinners', 'show_bars', 'show_themes',
 )
 
+
+def __getattr__(name):
+    # the exhibit is only needed when showing the styles, so it is only imported on demand,
+    # instead of on every alive_bar, which resolves its styles through this package.
+    if name in ('Show', 'showtime', 'show_spinners', 'show_bars', 'show_themes'):
+        from . import exhibit  # must not be on top.
+        return getattr(exhibit, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 # I want to create some kind of extension point here. Then users would be able to create
 # and share their custom styles with the community! Ideally it should be simple to distribute
 # them, don't know for sure how. As a last resort, I could include them all here in this package,
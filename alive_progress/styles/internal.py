@@ -1,3 +1,5 @@
+from collections.abc import MutableMapping
+
 from ..animations.bars import bar_factory
 from ..animations.spinners import alongside_spinner_factory, bouncing_spinner_factory, \
     delayed_spinner_factory, frame_spinner_factory, scrolling_spinner_factory, \
@@ -8,110 +10,271 @@ def _filter(context):
     return {k: v for k, v in context.items() if not k.startswith('_')}
 
 
+class _Registry(MutableMapping):
+    """A mapping of names to styles, which are only built on their first lookup.
+
+    Each name maps to a zero-arg builder, so just the styles actually used are ever created,
+    instead of all of them at import time. Styles can also be set directly, like in a dict.
+    """
+
+    def __init__(self, builders):
+        self.__styles, self.__builders = {}, builders
+
+    def __getitem__(self, name):
+        try:
+            return self.__styles[name]
+        except KeyError:
+            builder = self.__builders[name]  # raises KeyError for unknown names.
+        # concurrent first lookups may build it twice, but only one is ever kept.
+        return self.__styles.setdefault(name, builder())
+
+    def __setitem__(self, name, style):
+        self.__styles[name], self.__builders[name] = style, None
+
+    def __delitem__(self, name):
+        del self.__builders[name]
+        self.__styles.pop(name, None)
+
+    def __iter__(self):
+        return iter(self.__builders)
+
+    def __len__(self):
+        return len(self.__builders)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self.__builders)})'
+
+
 def __create_spinners():
-    classic = frame_spinner_factory(r'-\|/')
-    stars = scrolling_spinner_factory('*', 4, 1, hide=False)
-    twirl = frame_spinner_factory('←↖↑↗→↘↓↙')
-    twirls = delayed_spinner_factory(twirl, 3)
-    horizontal = frame_spinner_factory('▏▎▍▌▋▊▉█').reshape(1).bounce().reshape(7)
-    vertical = frame_spinner_factory('▁▂▃▄▅▆▇█').reshape(1).bounce().reshape(7)
-    waves = delayed_spinner_factory(vertical, 3, 2)
-    waves2 = delayed_spinner_factory(vertical, 3, 5)
-    waves3 = delayed_spinner_factory(vertical, 3, 7)
-    dots = frame_spinner_factory('⠁⠈⠐⠠⢀⡀⠄⠂')
-    dots_waves = delayed_spinner_factory(dots, 5)
-    dots_waves2 = delayed_spinner_factory(dots, 5, 2)
-
-    _balloon = bouncing_spinner_factory('🎈', 12, background='⠁⠈⠐⠠⢀⡀⠄⠂', overlay=True)
-    it = sequential_spinner_factory(
-        _balloon,
-        _balloon,  # makes the balloon twice as common.
-        bouncing_spinner_factory('🤡', background='⠁⠈⠐⠠⢀⡀⠄⠂', overlay=False),
-        intermix=False
-    ).randomize()
-
-    ball_belt = bouncing_spinner_factory('●', 8, 0, '< >', hide=False)
-    balls_belt = bouncing_spinner_factory('●', 8, 1, r'/~\_', hide=False)
-    triangles = bouncing_spinner_factory(('▶', '◀'), 6, 2, hide=False)
-    brackets = bouncing_spinner_factory(('>', '<'), 8, 3, hide=False)
-    bubbles = bouncing_spinner_factory(('∙●⦿', '○'), 10, 5, hide=False)
-    circles = bouncing_spinner_factory('●', 8, background='○', hide=False)
-    squares = bouncing_spinner_factory('■', 8, background='□', hide=False)
-    flowers = bouncing_spinner_factory('💐🌷🌸🌹🌺🌻🌼', 12, (2, 4)).pause(center=6).randomize()
-    elements = bouncing_spinner_factory(('🔥💨', '🌊⚡️'), 6, 2)
-    loving = bouncing_spinner_factory(('😍🥰', '⭐️🤩'), 8, (2, 3), '. ', hide=False, overlay=True)
-
-    notes = bouncing_spinner_factory(('♩♪', '♫♬'), 8, 2, hide=False).pause(other=2)
-    notes2 = delayed_spinner_factory(scrolling_spinner_factory('♩♪♫♬'), 3)
-
-    arrow = scrolling_spinner_factory('>>----->', 15)
-    arrows = bouncing_spinner_factory(('→', '←'), 6, 3)
-    arrows2 = scrolling_spinner_factory('→➜➞➣➤➩➪➮', 5, 2, hide=False)
-    _arrows_left = scrolling_spinner_factory('.˱·˂°❮', 6, 3, right=False)
-    _arrows_right = scrolling_spinner_factory('.˲·˃°❯', 6, 3, right=True)
-    arrows_in = alongside_spinner_factory(_arrows_right, _arrows_left)
-    arrows_out = alongside_spinner_factory(_arrows_left, _arrows_right)
-
-    _core = frame_spinner_factory('∙○⦿●')
-    radioactive = alongside_spinner_factory(_arrows_left, _core, _arrows_right)
-
-    boat = bouncing_spinner_factory((r'*|___/', r'\___|*'), 12, background='_.--.',
-                                    hide=False, overlay=True)
-    fish = scrolling_spinner_factory("><((('>", 15, hide=False)
-    fish2 = bouncing_spinner_factory(("><('>", "<')><"), 12, hide=False)
-    _fish_trail = scrolling_spinner_factory('¸.·´¯`·.·´¯`·.¸¸.·´¯`·.><(((º>', 15)
-    _small_fishes = bouncing_spinner_factory(('><>     ><>', '<><  <><    <><'), 15)
-    fishes = sequential_spinner_factory(_small_fishes, _small_fishes, _fish_trail,
-                                        intermix=False).randomize()
-    crab = bouncing_spinner_factory((r'Y (••) Y', r'Y (  ) Y'), 15, background='⠠⢀⡀⡀⢀⠄⡀⡀',
-                                    hide=False, overlay=True)  # hey it's Ferris #rustacean!
-
-    _look = bouncing_spinner_factory(('Look!', "It's moving!"))
-    _alive = bouncing_spinner_factory(("It's alive!", "IT'S ALIVE!!"))
-    alive = sequential_spinner_factory(_look, _alive, intermix=False)  # yep, frankenstein...
-
-    wait = scrolling_spinner_factory('please wait...', right=False)
-    wait2 = bouncing_spinner_factory(('please', 'wait'), 15, hide=False).pause()
-    wait3 = bouncing_spinner_factory(('please', 'wait'), 15).pause(center=8)
-    wait4 = bouncing_spinner_factory(('processing', 'this is not easy, please hold on'), 15)
-
-    pulse = frame_spinner_factory((
-        r'•––––––––––––', r'•––––––––––––', r'•––––––––––––', r'•––––––––-–––',
-        r'–•–––––––––––', r'–•–––––––––––', r'–•–––––––––––', r'–•–––––––––––',
-        r'––•––––––––––', r'––√––––––––––', r'––•––––––––––', r'––•––––––––––',
-        r'–––•–––––––––', r'––√•–––––––––', r'–––•–––––––––', r'–––•–––––––––',
-        r'––––•––––––––', r'––√-•––––––––', r'––––√––––––––', r'––––•––––––––',
-        r'–––––•–––––––', r'––√--•–––––––', r'––––√\–––––––', r'–––––•–––––––',
-        r'––––––•––––––', r'––√--–•––––––', r'––––√\/––––––', r'––––––•––––––',
-        r'–––––––•–––––', r'–––--––•–––––', r'––––√\/•–––––', r'–––––––√–––––',
-        r'––––––––•––––', r'––––-–––•––––', r'––––√\/–•––––', r'–––––––√\––––',
-        r'–––––––––•–––', r'–––––––––•–––', r'–––––\/––•–––', r'–––––––√\•–––',
-        r'––––––––––•––', r'––––––––––•––', r'––––––/–––•––', r'–––––––√\-•––',
-        r'–––––––––––•–', r'–––––––––––•–', r'–––––––––––•–', r'–––––––√\-–•–',
-        r'––––––––––––•', r'––––––––––––•', r'––––––––––––•', r'––––––––\-––•',
-    )).reshape(4).transpose().randomize()
+    def classic():
+        return frame_spinner_factory(r'-\|/')
+
+    def stars():
+        return scrolling_spinner_factory('*', 4, 1, hide=False)
+
+    def twirl():
+        return frame_spinner_factory('←↖↑↗→↘↓↙')
+
+    def twirls():
+        return delayed_spinner_factory(SPINNERS['twirl'], 3)
+
+    def horizontal():
+        return frame_spinner_factory('▏▎▍▌▋▊▉█').reshape(1).bounce().reshape(7)
+
+    def vertical():
+        return frame_spinner_factory('▁▂▃▄▅▆▇█').reshape(1).bounce().reshape(7)
+
+    def waves():
+        return delayed_spinner_factory(SPINNERS['vertical'], 3, 2)
+
+    def waves2():
+        return delayed_spinner_factory(SPINNERS['vertical'], 3, 5)
+
+    def waves3():
+        return delayed_spinner_factory(SPINNERS['vertical'], 3, 7)
+
+    def dots():
+        return frame_spinner_factory('⠁⠈⠐⠠⢀⡀⠄⠂')
+
+    def dots_waves():
+        return delayed_spinner_factory(SPINNERS['dots'], 5)
+
+    def dots_waves2():
+        return delayed_spinner_factory(SPINNERS['dots'], 5, 2)
+
+    def _balloon():
+        return bouncing_spinner_factory('🎈', 12, background='⠁⠈⠐⠠⢀⡀⠄⠂', overlay=True)
+
+    def it():
+        balloon = _balloon()
+        return sequential_spinner_factory(
+            balloon,
+            balloon,  # makes the balloon twice as common.
+            bouncing_spinner_factory('🤡', background='⠁⠈⠐⠠⢀⡀⠄⠂', overlay=False),
+            intermix=False
+        ).randomize()
+
+    def ball_belt():
+        return bouncing_spinner_factory('●', 8, 0, '< >', hide=False)
+
+    def balls_belt():
+        return bouncing_spinner_factory('●', 8, 1, r'/~\_', hide=False)
+
+    def triangles():
+        return bouncing_spinner_factory(('▶', '◀'), 6, 2, hide=False)
+
+    def brackets():
+        return bouncing_spinner_factory(('>', '<'), 8, 3, hide=False)
+
+    def bubbles():
+        return bouncing_spinner_factory(('∙●⦿', '○'), 10, 5, hide=False)
+
+    def circles():
+        return bouncing_spinner_factory('●', 8, background='○', hide=False)
+
+    def squares():
+        return bouncing_spinner_factory('■', 8, background='□', hide=False)
+
+    def flowers():
+        return bouncing_spinner_factory('💐🌷🌸🌹🌺🌻🌼', 12, (2, 4)).pause(center=6).randomize()
+
+    def elements():
+        return bouncing_spinner_factory(('🔥💨', '🌊⚡️'), 6, 2)
+
+    def loving():
+        return bouncing_spinner_factory(('😍🥰', '⭐️🤩'), 8, (2, 3), '. ', hide=False, overlay=True)
+
+    def notes():
+        return bouncing_spinner_factory(('♩♪', '♫♬'), 8, 2, hide=False).pause(other=2)
+
+    def notes2():
+        return delayed_spinner_factory(scrolling_spinner_factory('♩♪♫♬'), 3)
+
+    def arrow():
+        return scrolling_spinner_factory('>>----->', 15)
+
+    def arrows():
+        return bouncing_spinner_factory(('→', '←'), 6, 3)
+
+    def arrows2():
+        return scrolling_spinner_factory('→➜➞➣➤➩➪➮', 5, 2, hide=False)
+
+    def _arrows_left():
+        return scrolling_spinner_factory('.˱·˂°❮', 6, 3, right=False)
+
+    def _arrows_right():
+        return scrolling_spinner_factory('.˲·˃°❯', 6, 3, right=True)
+
+    def arrows_in():
+        return alongside_spinner_factory(_arrows_right(), _arrows_left())
+
+    def arrows_out():
+        return alongside_spinner_factory(_arrows_left(), _arrows_right())
+
+    def _core():
+        return frame_spinner_factory('∙○⦿●')
+
+    def radioactive():
+        return alongside_spinner_factory(_arrows_left(), _core(), _arrows_right())
+
+    def boat():
+        return bouncing_spinner_factory((r'*|___/', r'\___|*'), 12, background='_.--.',
+                                        hide=False, overlay=True)
+
+    def fish():
+        return scrolling_spinner_factory("><((('>", 15, hide=False)
+
+    def fish2():
+        return bouncing_spinner_factory(("><('>", "<')><"), 12, hide=False)
+
+    def _fish_trail():
+        return scrolling_spinner_factory('¸.·´¯`·.·´¯`·.¸¸.·´¯`·.><(((º>', 15)
+
+    def _small_fishes():
+        return bouncing_spinner_factory(('><>     ><>', '<><  <><    <><'), 15)
+
+    def fishes():
+        small_fishes = _small_fishes()
+        return sequential_spinner_factory(small_fishes, small_fishes, _fish_trail(),
+                                          intermix=False).randomize()
+
+    def crab():
+        return bouncing_spinner_factory((r'Y (••) Y', r'Y (  ) Y'), 15,
+                                        background='⠠⢀⡀⡀⢀⠄⡀⡀', hide=False,
+                                        overlay=True)  # hey it's Ferris #rustacean!
+
+    def _look():
+        return bouncing_spinner_factory(('Look!', "It's moving!"))
+
+    def _alive():
+        return bouncing_spinner_factory(("It's alive!", "IT'S ALIVE!!"))
+
+    def alive():
+        return sequential_spinner_factory(_look(), _alive(), intermix=False)  # yep, frankenstein...
+
+    def wait():
+        return scrolling_spinner_factory('please wait...', right=False)
+
+    def wait2():
+        return bouncing_spinner_factory(('please', 'wait'), 15, hide=False).pause()
+
+    def wait3():
+        return bouncing_spinner_factory(('please', 'wait'), 15).pause(center=8)
+
+    def wait4():
+        return bouncing_spinner_factory(('processing', 'this is not easy, please hold on'), 15)
+
+    def pulse():
+        return frame_spinner_factory((
+            r'•––––––––––––', r'•––––––––––––', r'•––––––––––––', r'•––––––––-–––',
+            r'–•–––––––––––', r'–•–––––––––––', r'–•–––––––––––', r'–•–––––––––––',
+            r'––•––––––––––', r'––√––––––––––', r'––•––––––––––', r'––•––––––––––',
+            r'–––•–––––––––', r'––√•–––––––––', r'–––•–––––––––', r'–––•–––––––––',
+            r'––––•––––––––', r'––√-•––––––––', r'––––√––––––––', r'––––•––––––––',
+            r'–––––•–––––––', r'––√--•–––––––', r'––––√\–––––––', r'–––––•–––––––',
+            r'––––––•––––––', r'––√--–•––––––', r'––––√\/––––––', r'––––––•––––––',
+            r'–––––––•–––––', r'–––--––•–––––', r'––––√\/•–––––', r'–––––––√–––––',
+            r'––––––––•––––', r'––––-–––•––––', r'––––√\/–•––––', r'–––––––√\––––',
+            r'–––––––––•–––', r'–––––––––•–––', r'–––––\/––•–––', r'–––––––√\•–––',
+            r'––––––––––•––', r'––––––––––•––', r'––––––/–––•––', r'–––––––√\-•––',
+            r'–––––––––––•–', r'–––––––––––•–', r'–––––––––––•–', r'–––––––√\-–•–',
+            r'––––––––––––•', r'––––––––––––•', r'––––––––––––•', r'––––––––\-––•',
+        )).reshape(4).transpose().randomize()
 
     return _filter(locals())
 
 
 def __create_bars():
-    smooth = bar_factory('▏▎▍▌▋▊▉█')
-    classic = bar_factory('=', tip='>', borders='[]', errors='!x')
-    classic2 = bar_factory('#', background='.', borders='[]', errors='!x')
-    brackets = bar_factory('>')
-    blocks = bar_factory('▏▎▍▌▋▊▉')
-    bubbles = bar_factory('∙○⦿●', borders='<>')
-    solid = bar_factory('∙□☐■', borders='<>')
-    checks = bar_factory('✓')
-    circles = bar_factory('●', background='○', borders='<>')
-    squares = bar_factory('■', background='□', borders='<>')
-    halloween = bar_factory('🎃', background='   👻   💀', errors=('😱', '🗡🗡🗡🗡'))
-    filling = bar_factory('▁▂▃▄▅▆▇█')
-    notes = bar_factory('♩♪♫♬', errors='♭♯')
-    ruler = bar_factory(tip='┃', background='∙∙∙∙.')
-    ruler2 = bar_factory(tip='┃', background='∙∙∙∙+')
-    fish = bar_factory(tip="><('>", background='¸.·´¯`·.·´¯`·.¸¸.·´¯`·.')
-    scuba = bar_factory(tip='>=≗)o', background='⠠⢀⡀⡀⢀⠄⡀⡀')
+    def smooth():
+        return bar_factory('▏▎▍▌▋▊▉█')
+
+    def classic():
+        return bar_factory('=', tip='>', borders='[]', errors='!x')
+
+    def classic2():
+        return bar_factory('#', background='.', borders='[]', errors='!x')
+
+    def brackets():
+        return bar_factory('>')
+
+    def blocks():
+        return bar_factory('▏▎▍▌▋▊▉')
+
+    def bubbles():
+        return bar_factory('∙○⦿●', borders='<>')
+
+    def solid():
+        return bar_factory('∙□☐■', borders='<>')
+
+    def checks():
+        return bar_factory('✓')
+
+    def circles():
+        return bar_factory('●', background='○', borders='<>')
+
+    def squares():
+        return bar_factory('■', background='□', borders='<>')
+
+    def halloween():
+        return bar_factory('🎃', background='   👻   💀', errors=('😱', '🗡🗡🗡🗡'))
+
+    def filling():
+        return bar_factory('▁▂▃▄▅▆▇█')
+
+    def notes():
+        return bar_factory('♩♪♫♬', errors='♭♯')
+
+    def ruler():
+        return bar_factory(tip='┃', background='∙∙∙∙.')
+
+    def ruler2():
+        return bar_factory(tip='┃', background='∙∙∙∙+')
+
+    def fish():
+        return bar_factory(tip="><('>", background='¸.·´¯`·.·´¯`·.¸¸.·´¯`·.')
+
+    def scuba():
+        return bar_factory(tip='>=≗)o', background='⠠⢀⡀⡀⢀⠄⡀⡀')
 
     return _filter(locals())
 
@@ -125,6 +288,6 @@ def __create_themes():
     return _filter(locals())
 
 
-SPINNERS = __create_spinners()
-BARS = __create_bars()
+SPINNERS = _Registry(__create_spinners())
+BARS = _Registry(__create_bars())
 THEMES = __create_themes()
@@ -1,10 +1,18 @@
+import os
+import subprocess
+import sys
+import threading
+import time
 import timeit
 
 from about_time.human_duration import fn_human_duration
 
 from .utils import toolkit
 from ..core.configuration import config_handler
-from ..core.progress import __alive_bar
+from ..core.progress import __alive_bar, _create_spinner_player
+from ..utils import terminal
+from ..styles.internal import BARS
+from ..utils.cells import fix_cells, join_cells, render_cells
 
 human_duration = fn_human_duration(False)
 
@@ -17,9 +25,9 @@ def overhead(total=None, *, calibrate=None, **options):
     with __alive_bar(config, total, calibrate=calibrate, _cond=__lock, _sampling=True) as loc:
         # the timing of the print_cells function increases proportionately with the
         # number of columns in the terminal, so I want a baseline here `VOID.cols == 0`.
-        res = timeit.repeat('alive_repr()', repeat=repeat, number=number, globals=loc)
+        res = timeit.repeat('alive_repr(term)', repeat=repeat, number=number, globals=loc)
 
-    return human_duration(min(res) / number)
+    return human_duration(min(res) / number, None)
 
 
 OVERHEAD_SAMPLING_GROUP = [
@@ -61,6 +69,230 @@ def overhead_sampling():
         print('|')
 
 
+def bar_overhead(total=None, **options):
+    number = 100_000  # timeit number of bar() calls inside each repetition.
+    repeat = 20  # timeit how many times to repeat the whole test.
+
+    config = config_handler(disable=True, **options)
+    with __alive_bar(config, total, _cond=__lock, _sampling=True) as loc:
+        res = timeit.repeat('bar()', repeat=repeat, number=number, globals=loc)
+
+    return human_duration(min(res) / number, None)
+
+
+BAR_OVERHEAD_SAMPLING_GROUP = [
+    ('definite', dict(total=1_000_000)),
+    ('unknown', dict()),
+]
+BAR_OVERHEAD_SAMPLING = [
+    ('default', dict()),
+    ('fast', dict(fast=True)),
+]
+
+
+def bar_overhead_sampling():
+    max_name = max(len(x) for x, _ in BAR_OVERHEAD_SAMPLING)
+    print(f'{"bar()":>{max_name}} | {" | ".join(g for g, _ in BAR_OVERHEAD_SAMPLING_GROUP)} |')
+    for name, config in BAR_OVERHEAD_SAMPLING:
+        print(f'{name:>{max_name}} ', end='', flush=True)
+        for group, data in BAR_OVERHEAD_SAMPLING_GROUP:
+            print(f'| {bar_overhead(**data, **config):^{len(group)}} ', end='', flush=True)
+        print('|')
+
+
+def contention(workers, *, locked=False, **options):
+    number = 100_000  # how many bar() calls each thread does.
+
+    config = config_handler(disable=True, **options)
+    with __alive_bar(config, workers * number, _sampling=True) as loc:
+        bar, lock = loc['bar'], threading.Lock()
+        if locked:
+            def call():
+                with lock:
+                    bar()
+        else:
+            call = bar
+
+        def work():
+            for _ in range(number):
+                call()
+
+        threads = [threading.Thread(target=work) for _ in range(workers)]
+        start = time.perf_counter()
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+        duration = time.perf_counter() - start
+        loc['sync_update_hook']()
+        lost = workers * number - loc['run'].count
+
+    return human_duration(duration / number / workers, None), lost
+
+
+CONTENTION_SAMPLING = [
+    ('default', dict()),
+    ('locked', dict(locked=True)),
+    ('threads', dict(threads=True)),
+]
+
+
+def contention_sampling():
+    max_name = max(len(x) for x, _ in CONTENTION_SAMPLING)
+    groups = 1, 4, 16, 32
+    print(f'{"workers":>{max_name}} | {" | ".join(f"{g:^16}" for g in groups)} |')
+    for name, config in CONTENTION_SAMPLING:
+        print(f'{name:>{max_name}} ', end='', flush=True)
+        for workers in groups:
+            per_call, lost = contention(workers, **config)
+            print(f'| {per_call:>7} {f"-{lost}" if lost else "exact":<8} ', end='', flush=True)
+        print('|')
+
+
+def frame_overhead(cols, *, single, **options):
+    number = 2000  # timeit number of frames inside each repetition.
+    repeat = 20  # timeit how many times to repeat the whole test.
+
+    out = __WriteCounter(None)  # the file is only opened for the measurement.
+    term = terminal.get_term(out, True)
+    config = config_handler(disable=True, title='sampling', **options)
+    with __alive_bar(config, 1000, _cond=__lock, _sampling=True) as loc:
+        loc['bar'](500)
+        loc['set_text']('some situational message')
+        run, (spinner, spinner_suffix) = loc['run'], _create_spinner_player(config)
+        fragments = (run.title, loc['bar_repr'](.5), loc['bar_suffix'], next(spinner),
+                     spinner_suffix, loc['monitor'](), loc['elapsed'](), loc['stats'](), *run.text)
+
+    if single:
+        stmt = 'line, _ = render_cells(fragments, cols, term, cols); term.write(line); term.flush()'
+    else:
+        stmt = 'print_cells(fragments, cols, term, cols); term.flush()'
+    with open(os.devnull, 'w') as out.file:
+        res = timeit.repeat(stmt, repeat=repeat, number=number, globals=dict(
+            fragments=fragments, cols=cols, term=term, print_cells=__print_cells_per_fragment,
+            render_cells=render_cells))
+
+    return human_duration(min(res) / number, None), out.writes // (repeat * number)
+
+
+def __print_cells_per_fragment(fragments, cols, term, last_line_len=0):
+    # the previous implementation of `print_cells`, which issued one write per fragment.
+    available = cols
+    term.write(term.carriage_return)
+    for fragment in filter(None, fragments):
+        if fragment == '\n':
+            term.clear_end_line(available)
+            available = cols
+        elif available == 0:
+            continue
+        else:
+            length = len(fragment)
+            if length <= available:
+                available -= length
+            else:
+                available, fragment = 0, fix_cells(fragment[:available])
+
+        term.write(join_cells(fragment))
+
+    if last_line_len and cols - available < last_line_len:
+        term.clear_end_line(available)
+
+    return cols - available
+
+
+FRAME_OVERHEAD_SAMPLING = [
+    ('multiple writes', dict(single=False)),
+    ('single write', dict(single=True)),
+]
+
+
+def frame_overhead_sampling():
+    max_name = max(len(x) for x, _ in FRAME_OVERHEAD_SAMPLING)
+    groups = 40, 80, 120, 200
+    print(f'{"cols":>{max_name}} | {" | ".join(f"{g:^16}" for g in groups)} |')
+    for name, config in FRAME_OVERHEAD_SAMPLING:
+        print(f'{name:>{max_name}} ', end='', flush=True)
+        for cols in groups:
+            per_frame, writes = frame_overhead(cols, **config)
+            print(f'| {per_frame:>6} {f"{writes} writes":<10}', end='', flush=True)
+        print('|')
+
+
+class __WriteCounter:
+    def __init__(self, file):
+        self.file, self.writes = file, 0
+
+    def write(self, text):
+        self.writes += 1
+        return self.file.write(text)
+
+    def flush(self):
+        self.file.flush()
+
+    def fileno(self):
+        raise OSError  # not a terminal, so the cols are the ones sent.
+
+
+def bar_render_overhead(name, length, sweeps):
+    steps = 1000  # how many percentages in each sweep, from 0 to 1.
+
+    bar = BARS[name](length)
+    percents = [i / steps for i in range(steps + 1)]
+    start = time.perf_counter()
+    for _ in range(sweeps):
+        for percent in percents:
+            bar(percent)
+    return human_duration((time.perf_counter() - start) / sweeps / len(percents), None)
+
+
+def bar_render_sampling():
+    max_name = max(len(x) for x in BARS)
+    groups = 40, 200
+    print(f'{"length":>{max_name}} | {" | ".join(f"{g:^17}" for g in groups)} |')
+    header = f'{"first":>8} {"next":>8}'
+    print(f'{"":>{max_name}} | {" | ".join(header for _ in groups)} |')
+    for name in BARS:
+        print(f'{name:>{max_name}} ', end='', flush=True)
+        for length in groups:  # the first sweep renders all frames, the next ones reuse them.
+            first = bar_render_overhead(name, length, 1)
+            print(f'| {first:>8} {bar_render_overhead(name, length, 20):>8} ', end='', flush=True)
+        print('|')
+
+
+def import_time(statement):
+    repeat = 7  # how many fresh interpreters, the fastest one is kept.
+
+    def run(code):
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                 capture_output=True, text=True, check=True)
+        # only the top level imports, as their cumulative times already include the nested ones.
+        lines = (line.split('|') for line in process.stderr.splitlines()
+                 if line.startswith('import time:') and not line.split('|')[-1].startswith('  '))
+        return sum(int(cumulative) for _, cumulative, _ in lines
+                   if cumulative.strip().isdigit()), process.stdout.split()
+
+    probe = '; import sys; print(*(m for m in HEAVY if m in sys.modules))'
+    baseline = min(run('pass')[0] for _ in range(repeat))
+    timings, loaded = zip(*(run(f'HEAVY = {HEAVY!r}; {statement}{probe}') for _ in range(repeat)))
+    return human_duration((min(timings) - baseline) / 1e6, None), loaded[0]
+
+
+HEAVY = ('about_time', 'grapheme', 'logging', 'alive_progress.animations',
+         'alive_progress.styles.internal', 'alive_progress.styles.exhibit')
+IMPORT_TIME_SAMPLING = [
+    ('import', 'import alive_progress'),
+    ('config', 'from alive_progress import config_handler; config_handler()'),
+    ('bar', 'from alive_progress import alive_bar\nwith alive_bar(1, disable=True) as b: b()'),
+]
+
+
+def import_time_sampling():
+    max_name = max(len(x) for x, _ in IMPORT_TIME_SAMPLING)
+    print(f'{"startup":>{max_name}} | {"time":^8} | heavy modules loaded')
+    for name, statement in IMPORT_TIME_SAMPLING:
+        print(f'{name:>{max_name}} ', end='', flush=True)
+        duration, loaded = import_time(statement)
+        print(f'| {duration:>8} | {", ".join(loaded) or "-"}')
+
+
 def __noop_p(_ignore):
     return 0
 
@@ -72,8 +304,19 @@ class __lock:
     def __exit__(self, _type, value, traceback):
         pass
 
+    def acquire(self, blocking=True):
+        return True
+
+    def release(self):
+        pass
+
 
 if __name__ == '__main__':
     parser, run = toolkit('Estimates the alive_progress overhead per cycle on your system.')
 
     run(overhead_sampling)
+    run(bar_overhead_sampling)
+    run(contention_sampling)
+    run(frame_overhead_sampling)
+    run(bar_render_sampling)
+    run(import_time_sampling)
@@ -69,12 +69,23 @@ Support for these cool chars, like Emojis 😃, was so damn hard to implement be
 """
 
 import unicodedata
+from functools import lru_cache
 
 from . import sanitize
 
 VS_15 = '\ufe0e'
 
 
+class Rendered(tuple):
+    """A fragment of cells which also carries its joined text, so it can be printed as is,
+    without stripping the marks and joining the cells again on every frame."""
+
+    def __new__(cls, cells, text=None):
+        rendered = super().__new__(cls, cells)
+        rendered.text = join_cells(rendered) if text is None else text
+        return rendered
+
+
 def print_cells(fragments, cols, term, last_line_len=0):
     """Print a tuple of fragments of tuples of cells on the terminal, until a given number of
     cols is achieved, slicing over cells when needed.
@@ -91,11 +102,24 @@ def print_cells(fragments, cols, term, last_line_len=0):
         the number of actually used cols.
 
     """
-    available = cols
-    term.write(term.carriage_return)
+    line, used = render_cells(fragments, cols, term, last_line_len)
+    term.write(line)
+    return used
+
+
+def render_cells(fragments, cols, term, last_line_len=0):
+    """Render a tuple of fragments of tuples of cells into a single string, escape sequences
+    included, so it can be sent to the terminal with only one write.
+    The arguments are the same as `print_cells`.
+
+    Returns:
+        the rendered line, and the number of actually used cols.
+
+    """
+    available, parts = cols, [term.carriage_return]
     for fragment in filter(None, fragments):
         if fragment == '\n':
-            term.clear_end_line(available)
+            parts.append(term.clear_end_line_text(available))
             available = cols
         elif available == 0:
             continue
@@ -106,12 +130,17 @@ def print_cells(fragments, cols, term, last_line_len=0):
             else:
                 available, fragment = 0, fix_cells(fragment[:available])
 
-        term.write(join_cells(fragment))
+        if isinstance(fragment, str):
+            parts.append(fragment)
+        elif isinstance(fragment, Rendered):  # it won't be anymore if it was truncated.
+            parts.append(fragment.text)
+        else:
+            parts.append(join_cells(fragment))
 
     if last_line_len and cols - available < last_line_len:
-        term.clear_end_line(available)
+        parts.append(term.clear_end_line_text(available))
 
-    return cols - available
+    return ''.join(parts), cols - available
 
 
 def join_cells(fragment):
@@ -158,8 +187,12 @@ def fix_cells(chars):
     return (*start, *chars[bool(start):-1 if end else None], *end)  # noqa
 
 
+@lru_cache(maxsize=1024)  # texts and titles usually come from a small set of recurring ones.
 def to_cells(text):
-    return mark_graphemes(split_graphemes(sanitize(text)))
+    text = sanitize(text)
+    if text.isascii():  # each ascii char is a whole grapheme, and none of them is wide.
+        return Rendered(text, text)
+    return Rendered(mark_graphemes(split_graphemes(text)))
 
 
 def split_graphemes(text):
@@ -168,7 +201,12 @@ def split_graphemes(text):
 
 
 def mark_graphemes(gs):
-    return sum(((g, *((None,) if is_wide(g) else ())) for g in gs), ())
+    marked = []
+    for g in gs:
+        marked.append(g)
+        if is_wide(g):
+            marked.append(None)
+    return tuple(marked)
 
 
 def strip_marks(chars):
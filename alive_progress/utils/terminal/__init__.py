@@ -23,10 +23,13 @@ def _create(mod, interactive):
         carriage_return=mod.carriage_return,
         clear_line=mod.clear_line,
         clear_end_line=mod.clear_end_line,
+        clear_end_line_text=mod.clear_end_line_text,
         clear_end_screen=mod.clear_end_screen,
         hide_cursor=mod.hide_cursor,
         show_cursor=mod.show_cursor,
         factory_cursor_up=mod.factory_cursor_up,
+        watch_resize=mod.watch_resize,
+        unwatch_resize=mod.unwatch_resize,
     )
     return terminal
 
@@ -15,12 +15,16 @@ def get_from(parent):
             write(' ')
         flush()
 
+    def clear_end_line_text(available=None):
+        return ' ' * (available or 0)
+
     clear_end_screen = clear_end_line
 
     # it seems spaces are appropriately handled to not wrap lines.
     _clear_line = f'\r{" " * cols()}\r'
 
     from .void import factory_cursor_up, hide_cursor, show_cursor  # noqa
+    from .void import unwatch_resize, watch_resize  # noqa
 
     flush = parent.flush
     write = parent.write
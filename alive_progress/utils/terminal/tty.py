@@ -1,17 +1,29 @@
 import os
+import signal
+import threading
+import time
 from types import SimpleNamespace
 
+POLL_SECS = 1.  # how often to refresh the cached size, when there's no SIGWINCH handler.
+
 
 def new(original, max_cols):
     write = original.write
     flush = original.flush
 
     try:
-        _fd = original.fileno()
+        _fd = _real_fd = original.fileno()
     except OSError:
-        _fd = 1
+        _fd, _real_fd = 1, None
+
+    def cols():  # the size is cached, so the renderer doesn't do a syscall on every frame.
+        if cols.resizes != _on_resize.count \
+                or not _on_resize.installed and time.perf_counter() >= cols.expires:
+            cols.resizes, cols.expires = _on_resize.count, time.perf_counter() + POLL_SECS
+            cols.value = _fetch_cols()
+        return cols.value
 
-    def cols():
+    def _fetch_cols():
         try:
             return os.get_terminal_size(_fd)[0]
         except (ValueError, OSError):
@@ -19,6 +31,8 @@ def new(original, max_cols):
             # os.get_terminal_size() is unsupported
             return max_cols
 
+    cols.resizes, cols.expires = -1, 0.  # forces the first fetch.
+
     def _ansi_escape_sequence(code, param=''):
         def inner(_available=None):  # because of jupyter.
             write(inner.sequence)
@@ -31,9 +45,66 @@ def new(original, max_cols):
 
     clear_line = _ansi_escape_sequence('2K\r')  # clears the entire line: CSI n K -> with n=2.
     clear_end_line = _ansi_escape_sequence('K')  # clears line from cursor: CSI K.
+
+    def clear_end_line_text(_available=None):  # to be included within a larger write.
+        return clear_end_line.sequence
+
     clear_end_screen = _ansi_escape_sequence('J')  # clears screen from cursor: CSI J.
     hide_cursor = _ansi_escape_sequence('?25l')  # hides the cursor: CSI ? 25 l.
     show_cursor = _ansi_escape_sequence('?25h')  # shows the cursor: CSI ? 25 h.
     carriage_return = '\r'
 
+    def watch_resize():  # only while in use, and only for actual terminals.
+        if not watch_resize.active and _real_fd is not None:
+            watch_resize.active = _install_resize_handler(_real_fd)
+
+    def unwatch_resize():
+        if watch_resize.active:
+            watch_resize.active = False
+            _restore_resize_handler()
+
+    watch_resize.active = False
     return SimpleNamespace(**locals())
+
+
+def _on_resize(signum, frame):
+    _on_resize.count += 1  # invalidates the cached size of all terminals.
+    if callable(_on_resize.previous):
+        _on_resize.previous(signum, frame)
+
+
+_on_resize.count, _on_resize.installed, _on_resize.previous, _on_resize.users = 0, False, None, 0
+
+
+def _install_resize_handler(fd):
+    """Install the SIGWINCH handler for actual terminals, chaining any previous one, which is
+    only possible from the main thread. Otherwise, the cached sizes are polled every `POLL_SECS`.
+    It is shared by all the terminals using it, and restored when the last one is done.
+    """
+    if _on_resize.users:
+        _on_resize.users += 1
+        return True
+    if not hasattr(signal, 'SIGWINCH') or not os.isatty(fd) \
+            or threading.current_thread() is not threading.main_thread():
+        return False
+    try:
+        previous = signal.signal(signal.SIGWINCH, _on_resize)
+    except (ValueError, OSError):  # pragma: no cover
+        return False  # not in the main interpreter, or signals are unsupported.
+    if previous is not _on_resize:  # it may have been left behind by another thread.
+        _on_resize.previous = previous
+    _on_resize.installed, _on_resize.users = True, 1
+    return True
+
+
+def _restore_resize_handler():
+    _on_resize.users -= 1
+    if _on_resize.users:
+        return
+    _on_resize.installed = False  # polls the sizes again, even if it can't be restored.
+    try:
+        if signal.getsignal(signal.SIGWINCH) is _on_resize:  # only if it wasn't replaced since.
+            signal.signal(signal.SIGWINCH, _on_resize.previous or signal.SIG_DFL)
+            _on_resize.previous = None
+    except (ValueError, OSError):  # pragma: no cover
+        pass  # not in the main thread, so it stays, still chaining the previous one.
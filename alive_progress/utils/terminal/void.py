@@ -21,10 +21,21 @@ hide_cursor = _ansi_escape_sequence()
 show_cursor = _ansi_escape_sequence()
 
 
+def clear_end_line_text(_available=None):
+    return ''
+
+
 def factory_cursor_up(_):
     return _ansi_escape_sequence()
 
 
+def watch_resize():
+    pass
+
+
+unwatch_resize = watch_resize
+
+
 def cols():
     return 0  # more details in `alive_progress.tools.sampling#overhead`.
 
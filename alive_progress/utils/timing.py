@@ -1,5 +1,5 @@
 from collections import namedtuple
-from math import floor
+from math import exp, floor, log
 
 from typing import Callable
 
@@ -63,3 +63,147 @@ def gen_simple_exponential_smoothing(alpha: float, fn: Callable[[float, float],
         p = yield y_hat
         y = fn(*p)
         y_hat += alpha * (y - y_hat)
+
+
+class ExponentialSmoothing:
+    """The same simple exponential smoothing of `gen_simple_exponential_smoothing`, but as a
+    slotted object, which doesn't need to pack the arguments into tuples for each `.send()`.
+    It is the one with a fixed alpha per refresh, regardless of the time between them."""
+
+    __slots__ = ('alpha', 'fn', 'started', 'value')
+
+    def __init__(self, alpha: float, fn: Callable[[float, float], float]):
+        self.alpha, self.fn, self.value, self.started = alpha, fn, 0., False
+
+    def update(self, a: float, b: float) -> float:
+        if self.started:
+            self.value += self.alpha * (self.fn(a, b) - self.value)
+        elif a != 0. and b != 0.:
+            self.value, self.started = self.fn(a, b), True
+        return self.value
+
+
+class EwmaRate:
+    """An exponentially weighted moving average of the instantaneous rate, with a time-aware
+    alpha, so the weight of each sample depends on how long it took, instead of on the fps.
+    The half-life is the time it takes for a change in the rate to be half reflected."""
+
+    __slots__ = ('last_pos', 'last_t', 'tau', 'value')
+
+    def __init__(self, half_life: float = 2.):
+        self.tau, self.value, self.last_pos, self.last_t = half_life / log(2.), 0., 0., 0.
+
+    def update(self, pos: float, t: float) -> float:
+        dt = t - self.last_t
+        if dt <= 0.:
+            return self.value
+        if not self.value:  # bootstraps with the average rate.
+            self.value = pos / t if self.last_t == 0. else (pos - self.last_pos) / dt
+        else:
+            self.value += (1. - exp(-dt / self.tau)) * ((pos - self.last_pos) / dt - self.value)
+        self.last_pos, self.last_t = pos, t
+        return self.value
+
+
+class _Window:
+    """A fixed-size ring buffer of (t, pos) samples, in preallocated lists."""
+
+    __slots__ = ('index', 'ps', 'size', 'ts')
+
+    def __init__(self, size: int):
+        self.ts, self.ps, self.index, self.size = [0.] * size, [0.] * size, 0, 0
+
+    def add(self, pos: float, t: float) -> bool:
+        """Add a sample, if it is newer than the last one."""
+        if self.size and t <= self.ts[self.index - 1]:
+            return False
+        self.ts[self.index], self.ps[self.index] = t, pos
+        self.index = (self.index + 1) % len(self.ts)
+        self.size = min(self.size + 1, len(self.ts))
+        return True
+
+
+class WindowRate(_Window):
+    """The rate within a sliding window of the last samples, so old history doesn't matter."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, size: int = 32):
+        super().__init__(size)
+        self.value = 0.
+
+    def update(self, pos: float, t: float) -> float:
+        if self.add(pos, t):
+            oldest = self.index - self.size  # negative indexes wrap around the ring.
+            dt = t - (self.ts[oldest] if self.size > 1 else 0.)
+            self.value = (pos - (self.ps[oldest] if self.size > 1 else 0.)) / dt
+        return self.value
+
+
+class RegressionRate(_Window):
+    """The slope of a linear regression over a sliding window of the last samples, i.e. the
+    rate that best fits them, which is way less noisy than the first and last ones, so the
+    ETA extrapolated from it is steadier."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, size: int = 32):
+        super().__init__(size)
+        self.value = 0.
+
+    def update(self, pos: float, t: float) -> float:
+        if not self.add(pos, t):
+            return self.value
+        if self.size == 1:
+            self.value = pos / t
+            return self.value
+
+        n, ts, ps = self.size, self.ts, self.ps  # the order of the samples doesn't matter.
+        mean_t = mean_p = num = den = 0.
+        for i in range(n):
+            mean_t += ts[i]
+            mean_p += ps[i]
+        mean_t, mean_p = mean_t / n, mean_p / n
+        for i in range(n):
+            dt = ts[i] - mean_t
+            num += dt * (ps[i] - mean_p)
+            den += dt * dt
+        self.value = num / den
+        return self.value
+
+
+class SimpleEta:
+    """The time to reach the total at the current rate, as the rate estimators already smooth
+    it; negative when it can't be known."""
+
+    __slots__ = ('total',)
+
+    def __init__(self, total: float):
+        self.total = total
+
+    def update(self, pos: float, rate: float) -> float:
+        return (self.total - pos) / rate if rate > 0. else -1.
+
+
+ESTIMATORS = {  # the rate estimator factories, and whether the eta should be smoothed again.
+    'smooth': (lambda: ExponentialSmoothing(.3, lambda pos, elapsed: pos / elapsed), True),
+    'ewma': (EwmaRate, False),
+    'window': (WindowRate, False),
+    'regression': (RegressionRate, False),
+}
+
+
+def create_estimators(name: str, total: float):
+    """Create the rate and ETA estimators of a bar.
+
+    Args:
+        name: the name of the estimator, one of ESTIMATORS
+        total: the logic total of the bar, to estimate the ETA
+
+    Returns:
+        the rate and ETA estimators, objects with an `update(pos, t_or_rate)` method
+
+    """
+    factory, smooth_eta = ESTIMATORS[name]
+    eta = ExponentialSmoothing(.5, fn_simple_eta(total)) if smooth_eta else SimpleEta(total)
+    return factory(), eta
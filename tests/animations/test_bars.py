@@ -291,3 +291,19 @@ def test_unknown_bar(end, expected, spinner_test):
     bar = bar_factory('a')(10, spinner_factory=spinner_test(('1234567890',)))
     method = bar.unknown.end if end else bar.unknown
     assert join_cells(method()) == expected
+
+
+def test_unknown_bar_independent_players(spinner_test):
+    factory = bar_factory('a')
+    spinner = spinner_test(('1234567890', '0987654321'))
+    bar1, bar2 = factory(10, spinner_factory=spinner), factory(10, spinner_factory=spinner)
+    assert [join_cells(b()) for b in (bar1.unknown, bar1.unknown, bar2.unknown)] \
+           == ['|1234567890|', '|0987654321|', '|1234567890|']
+    assert bar1(.5) == bar2(.5)
+
+
+def test_bar_frames_reused():
+    bar = bar_factory('=', tip='>', errors='!x')(10)
+    assert bar(.5) is bar(.5) is bar(.501)
+    assert len({join_cells(bar.end(p)) for p in (.9999, 1., 1.5)}) == 3
+    assert join_cells(bar.end(.5)) != join_cells(bar(.5))
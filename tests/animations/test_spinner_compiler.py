@@ -0,0 +1,26 @@
+from alive_progress.animations import spinner_compiler
+from alive_progress.animations.spinners import frame_spinner_factory
+from alive_progress.animations.utils import spinner_player
+from alive_progress.utils.cells import Rendered
+
+
+def test_spinner_compiled_once_per_length(monkeypatch):
+    calls = []
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    original = spinner_compiler.spinner_compiler
+    monkeypatch.setattr(spinner_compiler, 'spinner_compiler', counting)
+    factory = frame_spinner_factory('abc')
+    player1, player2 = spinner_player(factory(3)), spinner_player(factory(3))
+    factory(4)
+    assert len(calls) == 2
+    assert [next(player1), next(player1), next(player2)] == [('a',) * 3, ('b',) * 3, ('a',) * 3]
+
+
+def test_spinner_frames_rendered():
+    frame = next(spinner_player(frame_spinner_factory(('😺a', 'b😺'))(3)))
+    assert isinstance(frame, Rendered)
+    assert frame.text == '😺a'
@@ -1,6 +1,8 @@
+import time
+
 import pytest
 
-from alive_progress.core.calibration import calibrated_fps, custom_fps
+from alive_progress.core.calibration import budgeted_fps, calibrated_fps, custom_fps
 
 
 @pytest.mark.parametrize('calibrate, rate, expected', [
@@ -34,3 +36,27 @@ def test_calibrate(calibrate, rate, expected):
 def test_custom(rate, expected):
     fps = custom_fps(rate)
     assert fps(rate) == expected
+
+
+@pytest.mark.parametrize('budget, cost, expected', [
+    (0., .01, 60.),
+    (.5, .001, 60.),
+    (.5, .01, pytest.approx(50.)),
+    (.01, .01, pytest.approx(1.)),
+])
+def test_budgeted(budget, cost, expected, monkeypatch):
+    fps = budgeted_fps(custom_fps(1 / 60), budget)
+    for start in 99., 100.:
+        monkeypatch.setattr(time, 'perf_counter', lambda: start + cost)  # noqa
+        fps.measure(start)
+    assert fps(1.) == expected
+
+
+def test_budgeted_monitoring(monkeypatch):
+    fps = budgeted_fps(custom_fps(1.), 0.)
+    assert fps.achieved() == 0. and fps.load() == 0.
+    for start in 10., 10.5, 11.:
+        monkeypatch.setattr(time, 'perf_counter', lambda: start + .05)  # noqa
+        fps.measure(start)
+    assert fps.achieved() == pytest.approx(2.)
+    assert fps.load() == pytest.approx(.1)
@@ -1,10 +1,12 @@
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
 
 from alive_progress.core.configuration import Config, ERROR, __style_input, \
     _bool_input_factory, _int_input_factory, create_config, _format_input_factory
-from alive_progress.styles.internal import BARS, SPINNERS, THEMES
+from alive_progress.styles.internal import BARS, SPINNERS, THEMES, _Registry
 
 
 @pytest.mark.parametrize('lower, upper, num, expected', [
@@ -119,6 +121,15 @@ def test_config_creation(handler):
     (dict(scale=False, manual=True, enrich_print=False, title_length=10), dict(scale=None)),
     (dict(spinner=None, manual=None), dict(manual=False)),
     (dict(scale=10), dict(scale='SI')),
+    (dict(metrics=9100), {}),
+    (dict(metrics='/tmp/bars.prom'), {}),
+    (dict(metrics=0), dict(metrics=None)),
+    (dict(metrics='0.0.0.0:9100'), dict(metrics=('0.0.0.0', 9100))),
+    (dict(metrics=':9100'), dict(metrics=('', 9100))),
+    (dict(metrics='[::1]:9100'), dict(metrics=('::1', 9100))),
+    (dict(render_budget=.01), {}),
+    (dict(perf=True), {}),
+    (dict(estimator='regression'), {}),
 ])
 def config_params(request):
     yield request.param
@@ -150,6 +161,11 @@ def test_config_local(config_params, handler):
     dict(spinner=SPINNERS['pulse'], bar='oops', unknown=SPINNERS['fish']),
     dict(hey=True),
     dict(length=10, cool='very'),
+    dict(metrics=70000),
+    dict(metrics=True),
+    dict(metrics='localhost:70000'),
+    dict(render_budget=2),
+    dict(estimator='kalman'),
 ])
 def config_params_error(request):
     yield request.param
@@ -177,3 +193,46 @@ def test_config_global_theme(config_params_theme, handler):
     handler.set_global(theme='cool')
     config = handler()
     assert {k: getattr(config, k) for k in params} == expected
+
+
+def test_config_profile(config_params, handler):
+    params, diff = config_params
+    expected = dict(params, **diff)
+    profile = handler.profile(**params)
+    handler.set_global(length=7)
+    assert handler(config=profile) is profile
+    config = handler(config=profile, title='cool')
+    assert {k: v for k, v in config._asdict().items() if k in params} == expected
+    assert config.title == 'cool' and config.length == (params.get('length') or 40)
+
+
+def test_config_profile_error(handler):
+    with pytest.raises(TypeError):
+        handler(config=dict(length=9))
+
+
+def test_config_global_snapshot(handler):
+    assert handler() is handler()
+    handler.set_global(length=9)
+    assert handler().length == 9
+
+
+def test_config_theme_validated_once(handler):
+    handler()  # initializes the global configuration.
+    lookup = _Registry.__getitem__
+    with mock.patch.dict(THEMES, cool=dict(bar='solid')), \
+            mock.patch.object(_Registry, '__getitem__', autospec=True, side_effect=lookup) as m:
+        assert handler(theme='cool').bar is handler(theme='cool').bar is BARS['solid']
+    assert m.call_count == 2  # the first theme expansion, and the assertion above.
+
+
+@pytest.mark.parametrize('statement, lazy', [
+    ('import alive_progress', ('about_time', 'grapheme', 'logging', 'alive_progress.animations',
+                               'alive_progress.styles')),
+    ('alive_progress.config_handler()', ('about_time', 'logging', 'alive_progress.styles.exhibit')),
+])
+def test_config_lazy_imports(statement, lazy):
+    probe = f'print(*(m for m in {lazy!r} if m in sys.modules))'
+    code = f'import sys, alive_progress; {statement}; {probe}'
+    process = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    assert process.returncode == 0 and process.stdout.split() == []
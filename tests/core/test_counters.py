@@ -0,0 +1,108 @@
+import io
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from alive_progress.core import counters as counters_module
+from alive_progress.core.configuration import config_handler
+from alive_progress.core.counters import SharedCounters
+from alive_progress.core.progress import __alive_bar
+
+
+@pytest.fixture
+def counters():
+    counters = SharedCounters(4)
+    yield counters
+    counters.close()
+
+
+def test_shared_counters(counters):
+    assert len(counters) == 4
+    assert counters.total() == 0
+
+    slot = pickle.loads(pickle.dumps(counters[1]))
+    slot()
+    slot(5)
+    counters[3](-2)
+    assert counters.total() == 4
+
+
+def test_shared_slots_detached(counters):
+    slot1, slot2 = counters[0], pickle.loads(pickle.dumps(counters[2]))
+    slot1(), slot2(3)
+    name = slot1.name
+    assert counters_module._attached[name][2] == 2
+    del slot1
+    assert counters_module._attached[name][2] == 1
+    del slot2
+    assert name not in counters_module._attached
+    assert counters.total() == 4
+
+
+@pytest.mark.parametrize('index', [-1, 4])
+def test_shared_counters_invalid_slot(index, counters):
+    with pytest.raises(IndexError):
+        counters[index]
+
+
+def work(n, progress):
+    for _ in range(n):
+        progress()
+
+
+@pytest.mark.parametrize('fast', [False, True])
+def test_progress_processes(fast):
+    config = config_handler(processes=3, fast=fast, force_tty=False, receipt=False,
+                            file=sys.stdout)
+    with __alive_bar(config, 300) as bar:
+        bar(10)
+        with ProcessPoolExecutor(3) as executor:
+            for i in range(3):
+                executor.submit(work, 100, bar.shared[i])
+    assert bar.current == 310
+
+
+def attached():
+    return len(counters_module._attached)
+
+
+def test_progress_processes_reused_pool():
+    config = config_handler(processes=1, force_tty=False, file=io.StringIO())
+    with ProcessPoolExecutor(1) as executor:
+        for _ in range(2):
+            with __alive_bar(config, 10) as bar:
+                executor.submit(work, 10, bar.shared[0]).result()
+            assert bar.current == 10
+            assert executor.submit(attached).result() == 0  # detached after its task.
+
+
+@pytest.mark.parametrize('fast', [False, True])
+def test_progress_processes_with_parent(fast):
+    config = config_handler(processes=3, fast=fast, force_tty=True, refresh_secs=.001,
+                            file=io.StringIO())
+    with __alive_bar(config, 500_000) as bar:  # the refresh thread syncs them concurrently.
+        with ProcessPoolExecutor(3) as executor:
+            futures = [executor.submit(work, 100_000, bar.shared[i]) for i in range(3)]
+            work(200_000, bar)
+            [f.result() for f in futures]
+    assert bar.current == 500_000
+
+
+@pytest.mark.parametrize('total, processes', [(80_010, 0), (None, 0), (80_310, 3)])
+def test_progress_threads(total, processes):
+    config = config_handler(threads=True, processes=processes, force_tty=False, receipt=False,
+                            file=sys.stdout)
+    with __alive_bar(config, total) as bar:
+        bar(10)
+        with ThreadPoolExecutor(8) as executor:
+            for _ in range(8):
+                executor.submit(work, 10_000, bar)
+        assert bar.current == 80_010  # there's no refresh thread, so they're summed on read.
+        if processes:
+            with ProcessPoolExecutor(processes) as executor:
+                for i in range(processes):
+                    executor.submit(work, 100, bar.shared[i])
+            assert bar.current == 80_010 + 100 * processes
+    assert bar.current == 80_010 + 100 * processes
@@ -0,0 +1,98 @@
+import socket
+from unittest import mock
+from urllib.request import urlopen
+
+import pytest
+
+from alive_progress.core.exporter import CONTENT_TYPE, _create_exporter, get_exporter
+
+
+def test_exporter_render():
+    exporter = _create_exporter(mock.Mock())
+    exporter.update(1, ('job "a"', 10, 100, 2.5, 36.0, 4.0))
+    exporter.update(2, (None, 3, None, 0., None, 1.5))
+    lines = exporter.render().splitlines()
+    assert lines[:4] == [
+        '# TYPE alive_progress_count gauge',
+        '# HELP alive_progress_count The current count of the bar.',
+        'alive_progress_count{bar="1",title="job \\"a\\""} 10',
+        'alive_progress_count{bar="2",title=""} 3',
+    ]
+    assert 'alive_progress_total{bar="1",title="job \\"a\\""} 100' in lines
+    assert not any(line.startswith('alive_progress_total{bar="2"') for line in lines)
+    assert not any(line.startswith('alive_progress_eta_seconds{bar="2"') for line in lines)
+    assert lines[-1] == '# EOF'
+
+
+def test_exporter_render_non_finite():
+    exporter = _create_exporter(mock.Mock())
+    exporter.update(1, ('a', 1, None, float('inf'), float('-inf'), float('nan')))
+    lines = exporter.render().splitlines()
+    assert 'alive_progress_rate{bar="1",title="a"} +Inf' in lines
+    assert 'alive_progress_eta_seconds{bar="1",title="a"} -Inf' in lines
+    assert 'alive_progress_elapsed_seconds{bar="1",title="a"} NaN' in lines
+
+
+def test_exporter_remove():
+    publish = mock.Mock()
+    exporter = _create_exporter(publish)
+    exporter.update(1, ('a', 1, None, 0., None, 0.))
+    exporter.remove(1)
+    exporter.remove(1)
+    assert publish.call_args_list == [mock.call(False), mock.call(True)]
+    assert 'bar="1"' not in exporter.render()
+
+
+def test_exporter_file(tmp_path):
+    path = str(tmp_path / 'bars.prom')
+    exporter = get_exporter(path)
+    assert get_exporter(path) is exporter
+    exporter.update(1, ('a', 1, 10, 0., None, 0.))
+    exporter.update(1, ('a', 2, 10, 0., None, 0.))  # too soon, it is not written.
+    with open(path) as f:
+        assert 'alive_progress_count{bar="1",title="a"} 1' in f.read()
+    exporter.remove(1)  # always written.
+    with open(path) as f:
+        assert 'bar="1"' not in f.read()
+    assert [p.name for p in tmp_path.iterdir()] == ['bars.prom']
+
+
+@pytest.fixture
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+@pytest.mark.parametrize('target', [int, lambda port: ('127.0.0.1', port)])
+def test_exporter_http(target, free_port):
+    exporter = get_exporter(target(free_port))
+    exporter.update(1, ('a', 5, 10, 1., 5., 5.))
+    try:
+        with urlopen(f'http://127.0.0.1:{free_port}/metrics', timeout=5) as response:
+            assert response.headers['Content-Type'] == CONTENT_TYPE
+            assert 'alive_progress_count{bar="1",title="a"} 5' in response.read().decode()
+    finally:
+        exporter.remove(1)
+        exporter.server.shutdown()
+        exporter.server.server_close()
+
+
+def test_exporter_http_same_address(free_port):
+    exporter = get_exporter(free_port)
+    try:
+        assert get_exporter(('127.0.0.1', free_port)) is exporter
+    finally:
+        exporter.server.shutdown()
+        exporter.server.server_close()
+
+
+def test_exporter_http_port_in_use():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        s.listen()
+        address = s.getsockname()
+        with pytest.warns(UserWarning, match='Metrics not exported'):
+            exporter = get_exporter(address)
+        exporter.update(1, ('a', 5, 10, 1., 5., 5.))
+        assert exporter.server is None and get_exporter(address) is exporter  # warned once.
@@ -1,12 +1,14 @@
 import logging
 import sys
+import time
 from contextlib import contextmanager
-from threading import Condition
+from threading import Condition, Event, Thread
 from unittest import mock
 
 import click
 import pytest
 
+from alive_progress.core import hook_manager as hook_manager_module
 from alive_progress.core.hook_manager import buffered_hook_manager
 from alive_progress.utils.terminal import get_term
 
@@ -85,6 +87,80 @@ def test_hook_manager_flush(capsys):
     assert capsys.readouterr().out == ''
 
 
+def test_hook_manager_counters(capsys):
+    def hold():
+        with cond:
+            held.set()
+            time.sleep(.02)
+
+    cond, held = Condition(), Event()
+    hook_manager = buffered_hook_manager('', None, 0, cond, get_term())
+    with install_hook(hook_manager):
+        print('ok')
+        holder = Thread(target=hold)
+        holder.start()
+        held.wait()
+        print('waited')
+        holder.join()
+    assert capsys.readouterr().out == 'ok\nwaited\n'
+    assert (hook_manager.writes(), hook_manager.flushes) == (4, 2)
+    assert hook_manager.lock_wait > .01
+
+
+def test_hook_manager_deferred(capsys):
+    def hold():
+        with cond:
+            held.set()
+            release.wait()
+
+    cond, held, release, pos = Condition(), Event(), Event(), [35]
+    hook_manager = buffered_hook_manager('on {}: ', lambda: pos[0], 0, cond, get_term())
+    hook_manager.deferred = True
+    with install_hook(hook_manager):
+        holder = Thread(target=hold)
+        holder.start()
+        held.wait()
+        print('ok')  # it would block here if the lock was needed.
+        print('partial', end='')
+        hook_manager.flush_buffers()  # the index is about to change.
+        pos[0] = 36
+        print('nope', end='')
+        release.set()
+        holder.join()
+        assert capsys.readouterr().out == ''
+        with cond:
+            hook_manager.drain()
+        assert capsys.readouterr().out == 'on 35: ok\non 35: partial\n'
+    assert capsys.readouterr().out == 'on 36: nope\n'
+    assert hook_manager.lock_wait == 0.
+
+
+def test_hook_manager_deferred_wakes_busy_renderer(capsys):
+    cond = Condition()
+    hook_manager = buffered_hook_manager('', None, 0, cond, get_term())
+    hook_manager.deferred = True
+    with install_hook(hook_manager), cond:  # the renderer is busy rendering a frame.
+        printer = Thread(target=print, args=('ok',))
+        printer.start()
+        printer.join()
+        start = time.perf_counter()
+        hook_manager.wait(5.)  # the wake was not lost.
+        assert time.perf_counter() - start < 1.
+        hook_manager.drain()
+        assert capsys.readouterr().out == 'ok\n'
+
+
+def test_hook_manager_deferred_flood(capsys, monkeypatch):
+    monkeypatch.setattr(hook_manager_module, 'MAX_QUEUED', 2)
+    hook_manager = buffered_hook_manager('', None, 0, Condition(), get_term())
+    hook_manager.deferred = True
+    with install_hook(hook_manager):
+        print('a')
+        print('b')
+        print('c')  # the queue was full, so the pending ones were emitted, in order.
+        assert capsys.readouterr().out == 'a\nb\nc\n'
+
+
 def test_hook_manager_do_clear_line_on_stdout():
     term = get_term()
     hook_manager = buffered_hook_manager('', None, 0, Condition(), term)
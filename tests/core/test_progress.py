@@ -1,8 +1,14 @@
+import asyncio
+import io
+import json
 import sys
+import threading
+import time
 
 import pytest
 
-from alive_progress.core.progress import __alive_bar, __AliveBarIteratorAdapter
+from alive_progress.core.progress import __alive_bar, __AliveBarIteratorAdapter, alive_bar, \
+    alive_multibar
 from alive_progress.core.configuration import config_handler
 
 DATA = {
@@ -46,7 +52,12 @@ def scale(request):
     yield request.param
 
 
-def test_progress_bar(enrich_print, total, manual, scale, capsys):
+@pytest.fixture(params=[True, False])
+def fast(request):
+    yield request.param
+
+
+def test_progress_bar(enrich_print, total, manual, scale, fast, capsys):
     def alive_bar_case(total_num):
         with __alive_bar(config, total_num, _testing=True) as bar:
             for i in range(n):
@@ -55,14 +66,14 @@ def test_progress_bar(enrich_print, total, manual, scale, capsys):
                 bar((i + 1) / n if manual else 1)
 
     n = 2468
-    config = config_handler(enrich_print=enrich_print, manual=manual, scale=scale,
+    config = config_handler(enrich_print=enrich_print, manual=manual, scale=scale, fast=fast,
                             length=3, bar='classic', force_tty=False, unit='U', file=sys.stdout)
 
     alive_bar_case(n if total else None)
     assert capsys.readouterr().out.strip() == DATA[enrich_print, total, manual, scale]
 
 
-def test_progress_it(enrich_print, total, scale, capsys):
+def test_progress_it(enrich_print, total, scale, fast, capsys):
     def alive_it_case(total_num):
         for i in __AliveBarIteratorAdapter(range(n), None,
                                            __alive_bar(config, total_num, _testing=True)):
@@ -70,8 +81,341 @@ def test_progress_it(enrich_print, total, scale, capsys):
                 print('half')  # this is not a debug, it's part of the test.
 
     n = 2468
-    config = config_handler(enrich_print=enrich_print, scale=scale,
+    config = config_handler(enrich_print=enrich_print, scale=scale, fast=fast,
                             length=3, bar='classic', force_tty=False, unit='U', file=sys.stdout)
 
     alive_it_case(n if total else None)
     assert capsys.readouterr().out.strip() == DATA[enrich_print, total, False, scale]
+
+
+@pytest.mark.parametrize('chunk', [7, 'auto', 5000])
+def test_progress_it_chunk(chunk):
+    n = 2468
+    config = config_handler(force_tty=False, receipt=False, file=sys.stdout)
+    bar = __AliveBarIteratorAdapter(range(n), None, __alive_bar(config, n, _testing=True), chunk)
+    assert sum(1 for _ in bar) == n
+    assert bar.current == n
+
+
+@pytest.mark.parametrize('chunk', [7, 'auto', 5000])
+def test_progress_it_chunk_interrupted(chunk):
+    config = config_handler(force_tty=False, receipt=False, file=sys.stdout)
+    bar = __AliveBarIteratorAdapter(range(100), None, __alive_bar(config, 100, _testing=True),
+                                    chunk)
+    with pytest.raises(ZeroDivisionError):
+        for i in bar:
+            if i == 10:
+                1 / 0
+    assert bar.current == 10  # the failed item is not counted.
+
+
+async def agen(n):
+    for i in range(n):
+        yield i
+
+
+@pytest.mark.parametrize('chunk', [None, 7, 'auto'])
+def test_progress_it_async(chunk):
+    async def main():
+        bar = __AliveBarIteratorAdapter(agen(n).__aiter__(), None,
+                                        __alive_bar(config, n, _testing=True), chunk)
+        assert [i async for i in bar] == list(range(n))
+        return bar.current
+
+    n = 2468
+    config = config_handler(force_tty=False, receipt=False, file=sys.stdout)
+    assert asyncio.run(main()) == n
+
+
+@pytest.mark.parametrize('chunk', [10, 'auto'])
+def test_progress_it_async_chunk_interrupted(chunk):
+    async def main():
+        bar = __AliveBarIteratorAdapter(agen(100).__aiter__(), None,
+                                        __alive_bar(config, 100, _testing=True), chunk)
+        async for i in bar:
+            if i == 24:
+                break
+        await asyncio.sleep(.01)  # the loop closes the abandoned async generators.
+        broken = bar.current
+
+        bar = __AliveBarIteratorAdapter(agen(100).__aiter__(), None,
+                                        __alive_bar(config, 100, _testing=True), chunk)
+        with pytest.raises(ZeroDivisionError):
+            async for i in bar:
+                if i == 10:
+                    1 / 0
+        await asyncio.sleep(.01)
+        return broken, bar.current
+
+    config = config_handler(force_tty=False, receipt=False, file=sys.stdout)
+    assert asyncio.run(main()) == (24, 10)  # the failed item is not counted.
+
+
+def test_progress_bar_async_renderer():
+    async def main():
+        async with __alive_bar(config, 10) as bar:
+            for _ in range(10):
+                await asyncio.sleep(.01)
+                bar()
+        return bar.current
+
+    buffer = io.StringIO()
+    config = config_handler(force_tty=True, renderer='asyncio', file=buffer, title='cool')
+    assert asyncio.run(main()) == 10
+    assert buffer.getvalue().count('cool') > 2  # the loop has rendered some frames.
+
+
+def test_progress_bar_async_renderer_needs_loop():
+    config = config_handler(force_tty=True, renderer='asyncio', file=io.StringIO())
+    with pytest.raises(UserWarning, match="'asyncio' renderer"), __alive_bar(config, 10):
+        pass
+
+
+@pytest.mark.parametrize('renderer', ['thread', 'asyncio'])
+def test_progress_bar_print_shown_right_away(renderer, capsys):
+    async def main():
+        async with __alive_bar(config, 10):
+            await asyncio.sleep(.02)  # the first frame.
+            print('hey')
+            await asyncio.sleep(.02)  # way less than a refresh.
+            return capsys.readouterr().out
+
+    config = config_handler(force_tty=True, renderer=renderer, file=sys.stdout, refresh_secs=1.)
+    assert 'hey' in asyncio.run(main())
+
+
+@pytest.mark.parametrize('renderer', ['thread', 'asyncio'])
+def test_progress_bar_json_status(renderer):
+    async def main():
+        async with __alive_bar(config, 20) as bar:
+            for i in range(20):
+                await asyncio.sleep(.005)
+                bar()
+                if i == 9:
+                    bar.text = 'half'
+
+    buffer = io.StringIO()
+    config = config_handler(force_tty=False, file=buffer, title='job', json_secs=.02,
+                            renderer=renderer)
+    asyncio.run(main())
+    *lines, receipt = buffer.getvalue().splitlines()
+    assert '\x1b' not in buffer.getvalue() and receipt.startswith('job |')
+    status = [json.loads(line) for line in lines]
+    assert 2 < len(status) < 20  # the writes are rate limited, not one per bar() call.
+    assert set(status[0]) == {'title', 'text', 'count', 'total', 'percent', 'rate', 'eta',
+                              'elapsed'}
+    assert all(s['title'] == 'job' and s['total'] == 20 for s in status)
+    assert status[-1]['text'] == 'half' and status[-1]['count'] > status[0]['count']
+
+
+@pytest.mark.parametrize('force_tty', [True, False])
+def test_progress_bar_metrics(force_tty, tmp_path, monkeypatch):
+    monkeypatch.setattr('alive_progress.core.exporter.EXPORT_SECS', 0.)
+    monkeypatch.setattr('alive_progress.core.progress.EXPORT_SECS', .01)
+    path, buffer = tmp_path / 'bars.prom', io.StringIO()
+    config = config_handler(force_tty=force_tty, file=buffer, title='job', metrics=str(path),
+                            refresh_secs=.01)
+    with __alive_bar(config, 10) as bar:
+        for _ in range(5):
+            time.sleep(.02)
+            bar()
+        time.sleep(.05)
+        exported = path.read_text()
+    assert 'title="job"} 5' in exported and 'alive_progress_total{' in exported
+    assert 'title="job"' not in path.read_text()  # only the active bars.
+    assert bar.receipt() and 'title="job"' not in path.read_text()  # not exported again.
+
+
+def test_progress_bar_pull_renderer():
+    buffer, threads = io.StringIO(), threading.active_count()
+    config = config_handler(force_tty=True, file=buffer, title='pull', renderer='pull',
+                            refresh_secs=1., spinner=None, stats=False)
+    with __alive_bar(config, 10) as bar:
+        assert threading.active_count() == threads  # no render thread.
+        bar()
+        frame = bar.tick(100.)
+        assert 'pull' in frame and buffer.getvalue().endswith(frame)
+        assert bar.tick(100.5) is None  # not due yet.
+        bar()
+        assert bar.tick(101.) == buffer.getvalue()[-len(frame):] != frame
+        assert bar.tick(102.) is None  # nothing has changed.
+        written = buffer.getvalue()
+        assert '2/10' in bar.render(write=False) and buffer.getvalue() == written
+    assert bar.render() is None and bar.tick() is None  # finished.
+
+
+@pytest.mark.parametrize('budget, due', [(0., True), (1e-6, False)])
+def test_progress_bar_render_budget(budget, due):
+    config = config_handler(force_tty=True, file=io.StringIO(), renderer='pull',
+                            refresh_secs=.01, render_budget=budget)
+    with __alive_bar(config, 10) as bar:
+        assert bar.fps == 0. and bar.load == 0.
+        for now in 100., 100.02:
+            bar()
+            assert bar.tick(now)
+        assert bar.fps > 0. and 0. < bar.load <= 1.
+        bar()
+        assert bool(bar.tick(100.04)) is due  # the frames cost way more than the budget.
+
+
+@pytest.mark.parametrize('perf', [False, True])
+def test_progress_bar_perf(perf):
+    buffer = io.StringIO()
+    config = config_handler(force_tty=True, file=buffer, perf=perf, refresh_secs=.01)
+    with __alive_bar(config, 10) as bar:
+        for _ in range(10):
+            time.sleep(.01)
+            bar()
+        print('done')
+    snapshot = bar.perf
+    assert snapshot.frames > 1 and snapshot.flushes == snapshot.frames + 1
+    assert 0. < snapshot.max_render_secs <= snapshot.render_secs
+    assert snapshot.chars > 0 and snapshot.hook_writes == 2  # the text and its newline.
+    assert snapshot.calls == (10 if perf else None)
+    assert ('perf: ' in buffer.getvalue()) is perf
+    assert bar.receipt() and bar.perf == snapshot  # the receipt is not a frame.
+    with pytest.raises(AttributeError):
+        bar.perf = None
+
+
+@pytest.mark.parametrize('estimator', ['smooth', 'ewma', 'window', 'regression'])
+def test_progress_bar_estimators(estimator):
+    config = config_handler(force_tty=True, file=io.StringIO(), renderer='pull',
+                            estimator=estimator)
+    with __alive_bar(config, 100) as bar:
+        for _ in range(5):
+            time.sleep(.01)
+            bar(10)
+            bar.render()
+        assert bar.rate.endswith('/s') and bar.eta.startswith('~')
+
+
+def test_progress_bar_widgets_incremental():
+    config = config_handler(disable=True, scale='SI')
+    with __alive_bar(config, 1000, _sampling=True) as loc:
+        run, monitor, elapsed, stats = loc['run'], loc['monitor'], loc['elapsed'], loc['stats']
+        loc['bar'](10)
+        run.elapsed, run.rate = 1.2, 8.21
+        texts = monitor(), elapsed(), stats()
+        run.elapsed, run.rate = 1.4, 8.210001  # the same at display precision.
+        assert (monitor(), elapsed(), stats()) == texts
+        assert all(new is old for new, old in zip((monitor(), elapsed(), stats()), texts))
+        loc['bar']()
+        run.elapsed, run.rate = 1.6, 8.4
+        assert monitor() != texts[0] and elapsed() != texts[1] and stats() != texts[2]
+        assert '11.0/' in monitor() and '8.4/s' in stats() and run.rate_text == '8.4/s'
+
+
+def test_progress_bar_pull_renderer_never_blocks():
+    def hold():
+        with cond:
+            held.set()
+            release.wait()
+
+    cond, held, release = threading.Condition(), threading.Event(), threading.Event()
+    config = config_handler(force_tty=True, file=io.StringIO(), renderer='pull')
+    with __alive_bar(config, 10, _cond=lambda: cond) as bar:
+        holder = threading.Thread(target=hold)
+        holder.start()
+        held.wait()
+        assert bar.render() is None
+        release.set()
+        holder.join()
+        assert bar.render()
+
+
+def test_progress_bar_pull_renderer_concurrent():
+    def pull(title, out):
+        config = config_handler(force_tty=True, file=out, title=title, renderer='pull')
+        return __alive_bar(config, 10)
+
+    first, second = io.StringIO(), io.StringIO()
+    with pull('first', first) as bar1, pull('second', second) as bar2:
+        bar1(), bar2(2)
+        assert '1/10' in bar1.render() and '2/10' in bar2.render()
+    assert 'first' in first.getvalue() and 'first' not in second.getvalue()
+    assert 'second' in second.getvalue() and 'second' not in first.getvalue()
+
+
+def test_progress_bar_render_needs_pull_renderer():
+    config = config_handler(force_tty=False, file=io.StringIO())
+    with __alive_bar(config, 10) as bar:
+        with pytest.raises(UserWarning):
+            bar.render()
+
+
+@pytest.mark.parametrize('force_tty', [True, False])
+def test_progress_multibar(force_tty):
+    def work(n):
+        with multi.bar(n, title=f'job{n}') as bar:
+            for _ in range(n):
+                time.sleep(.001)
+                bar()
+
+    buffer = io.StringIO()
+    with alive_multibar(force_tty=force_tty, file=buffer) as multi:
+        workers = [threading.Thread(target=work, args=(n,)) for n in (20, 30, 40)]
+        [w.start() for w in workers]
+        [w.join() for w in workers]
+
+    receipts = [line for line in buffer.getvalue().split('\n') if '100%]' in line]
+    assert len(receipts) == 3
+    assert all(f'job{n}' in ''.join(receipts) for n in (20, 30, 40))
+
+
+def test_progress_multibar_perf():
+    config = config_handler.profile(force_tty=True, file=io.StringIO(), refresh_secs=.002)
+    with alive_multibar(config=config) as multi, multi.bar(2) as bar1:
+        bar1()
+        time.sleep(.02)
+        with multi.bar(2) as bar2:
+            bar1(), bar2(2)
+            time.sleep(.02)
+    perf1, perf2 = bar1.perf, bar2.perf
+    assert perf1.frames > perf2.frames > 0
+    assert perf1.flushes == perf2.flushes > perf2.frames  # the same flushes serve both.
+
+
+def test_progress_multibar_pause():
+    with alive_multibar(force_tty=False, file=sys.stdout) as multi:
+        with multi.bar(1) as bar:
+            with pytest.raises(UserWarning):
+                with bar.pause():
+                    pass
+
+
+def test_progress_multibar_pull():
+    with alive_multibar(force_tty=False, file=io.StringIO()) as multi:
+        with pytest.raises(UserWarning):
+            with multi.bar(1, renderer='pull'):
+                pass
+    with pytest.raises(UserWarning):
+        with alive_multibar(force_tty=False, file=io.StringIO(), renderer='pull'):
+            pass
+
+
+def test_progress_bar_profile():
+    buffer = io.StringIO()
+    profile = config_handler.profile(force_tty=False, file=buffer, title='prof', stats=False)
+    for total in 2, 3:
+        with alive_bar(total, config=profile, monitor='{count} done') as bar:
+            [bar() for _ in range(total)]
+        with alive_multibar(config=profile) as multi, multi.bar(total, title='multi') as bar:
+            [bar() for _ in range(total)]
+    lines = buffer.getvalue().splitlines()
+    assert [line.split('|')[0].strip() for line in lines] == ['prof', 'multi'] * 2
+    assert [line.split('| ')[1].strip() for line in lines[::2]] == ['2 done in 0.0s',
+                                                                     '3 done in 0.0s']
+
+
+def test_progress_bar_skips_unchanged_frames():
+    buffer = io.StringIO()
+    config = config_handler(force_tty=True, spinner=None, refresh_secs=.005, file=buffer,
+                            title='cool', enrich_print=False)
+    with __alive_bar(config, 10):
+        time.sleep(.2)
+        frames = buffer.getvalue().count('cool')
+        assert frames <= 2  # only the elapsed time could have changed it.
+        print('hello')
+        time.sleep(.05)
+        assert buffer.getvalue().count('cool') == frames + 1  # redrawn once after printing.
@@ -0,0 +1,36 @@
+import pytest
+
+from alive_progress.styles.internal import BARS, SPINNERS, _Registry
+
+
+def test_registry_builds_on_first_lookup():
+    calls = []
+    registry = _Registry(dict(a=lambda: calls.append('a') or 'A', b=lambda: 'B'))
+    assert calls == [] and list(registry) == ['a', 'b'] and 'a' in registry
+    assert registry['a'] == 'A' and registry['a'] == 'A'
+    assert calls == ['a']
+
+
+def test_registry_unknown_name():
+    registry = _Registry(dict(a=lambda: 'A'))
+    assert registry.get('z') is None
+    with pytest.raises(KeyError):
+        registry['z']
+
+
+def test_registry_set_and_delete():
+    registry = _Registry(dict(a=lambda: 'A'))
+    registry['b'] = 'B'
+    assert dict(registry) == dict(a='A', b='B')
+    del registry['a']
+    assert list(registry) == ['b'] and len(registry) == 1
+
+
+@pytest.mark.parametrize('registry, name', [
+    (SPINNERS, 'waves'),
+    (SPINNERS, 'it'),
+    (BARS, 'smooth'),
+])
+def test_registry_styles_are_shared(registry, name):
+    assert registry[name] is registry[name]
+    assert callable(registry[name])
@@ -2,7 +2,8 @@ import sys
 
 import pytest
 
-from alive_progress.utils.cells import to_cells, print_cells
+from alive_progress.utils.cells import Rendered, mark_graphemes, print_cells, render_cells, \
+    split_graphemes, to_cells
 from alive_progress.utils.terminal import get_term
 
 
@@ -54,6 +55,15 @@ def test_sanitize_text_double(text, expected, show_marks):
     assert show_marks(result) == expected
 
 
+@pytest.mark.parametrize('text', ['a text', ' ~!@#$%^&*()_+{}|:"<>?`-=[]\\;\',./\t'])
+def test_to_cells_ascii_fast_path(text):
+    assert to_cells(text) == mark_graphemes(split_graphemes(text))
+
+
+def test_to_cells_cached():
+    assert to_cells('cached 😺') is to_cells('cached 😺')
+
+
 @pytest.mark.parametrize('fragments, cols, ret, expected', [
     (('ok', ' ', '1'), 10, 4, '\rok 1'),
     (('ok', ' ', '1'), 4, 4, '\rok 1'),
@@ -76,3 +86,23 @@ def test_print_cells_clear(capsys):
     assert print_cells((msg,), 100, term, 8) == len(msg)
     term.flush()
     assert capsys.readouterr().out == f'\r{msg}\x1b[K'
+
+
+@pytest.mark.parametrize('force_tty, expected', [
+    (True, '\rrog\x1b[K\n123\x1b[K'),
+    (False, 'rog\n123'),
+])
+def test_render_cells(force_tty, expected, capsys):
+    term = get_term(force_tty=force_tty)
+    assert render_cells(('rogerio', '\n', '12345'), 3, term, 5) == (expected, 3)
+    term.flush()
+    assert capsys.readouterr().out == ''  # nothing is written.
+
+
+def test_render_cells_rendered():
+    term = get_term(force_tty=True)
+    fragment = Rendered(('a', '😺', None, 'b'))
+    assert fragment.text == 'a😺b'
+    fragment.text = 'text'  # it is used as is, the cells are not joined again.
+    assert render_cells((fragment, ' ', 'str'), 10, term) == ('\rtext str', 8)
+    assert render_cells((fragment,), 2, term) == ('\ra ', 2)  # truncated.
@@ -0,0 +1,95 @@
+import io
+import os
+import signal
+
+import pytest
+
+from alive_progress.utils.terminal import tty
+
+
+@pytest.fixture
+def sizes(monkeypatch):
+    calls = []
+
+    def get_terminal_size(fd):
+        calls.append(fd)
+        return os.terminal_size((80 + len(calls), 24))
+
+    monkeypatch.setattr(tty.os, 'get_terminal_size', get_terminal_size)
+    return calls
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    monkeypatch.setattr(tty._on_resize, 'installed', True)
+    monkeypatch.setattr(tty._on_resize, 'previous', None)
+
+
+def test_cols_cached_with_handler(sizes, handler):
+    term = tty.new(io.StringIO(), 100)
+    assert [term.cols() for _ in range(5)] == [81] * 5
+    assert len(sizes) == 1
+
+
+def test_cols_refreshed_on_resize(sizes, handler):
+    term = tty.new(io.StringIO(), 100)
+    assert term.cols() == 81
+    tty._on_resize(signal.SIGINT, None)  # the signal number is not used.
+    assert term.cols() == 82
+    assert term.cols() == 82
+
+
+def test_cols_polled_without_handler(sizes, monkeypatch):
+    monkeypatch.setattr(tty._on_resize, 'installed', False)
+    monkeypatch.setattr(tty, 'POLL_SECS', 0.)
+    term = tty.new(io.StringIO(), 100)
+    assert term.cols() == 81
+    assert term.cols() == 82
+
+    monkeypatch.setattr(tty, 'POLL_SECS', 1000.)
+    term = tty.new(io.StringIO(), 100)
+    assert term.cols() == term.cols() == 83
+
+
+def test_cols_max_cols_fallback(monkeypatch):
+    def get_terminal_size(_fd):
+        raise OSError
+
+    monkeypatch.setattr(tty.os, 'get_terminal_size', get_terminal_size)
+    assert tty.new(io.StringIO(), 123).cols() == 123
+
+
+def test_resize_handler_chains_previous(monkeypatch):
+    received = []
+    monkeypatch.setattr(tty._on_resize, 'previous', lambda *args: received.append(args))
+    tty._on_resize(28, None)
+    assert received == [(28, None)]
+
+
+@pytest.fixture
+def pty():
+    master, replica = os.openpty()
+    with os.fdopen(replica, 'w') as f:
+        yield f
+    os.close(master)
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGWINCH'), reason='no SIGWINCH')
+def test_resize_handler_shared_and_restored(pty):
+    previous = signal.getsignal(signal.SIGWINCH)
+    term1, term2 = tty.new(pty, 100), tty.new(pty, 100)
+    term1.watch_resize(), term2.watch_resize(), term2.watch_resize()
+    assert signal.getsignal(signal.SIGWINCH) is tty._on_resize and tty._on_resize.installed
+    term1.unwatch_resize()
+    assert signal.getsignal(signal.SIGWINCH) is tty._on_resize
+    term2.unwatch_resize(), term2.unwatch_resize()
+    assert signal.getsignal(signal.SIGWINCH) is previous and not tty._on_resize.installed
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGWINCH'), reason='no SIGWINCH')
+def test_resize_handler_only_for_terminals():
+    previous = signal.getsignal(signal.SIGWINCH)
+    term = tty.new(io.StringIO(), 100)  # without a fileno, not even the fallback one.
+    term.watch_resize()
+    assert signal.getsignal(signal.SIGWINCH) is previous and not tty._on_resize.installed
+    term.unwatch_resize()
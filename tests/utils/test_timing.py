@@ -1,7 +1,8 @@
 import pytest
 
 from alive_progress.utils.timing import time_display, eta_text, fn_simple_eta, RUN, END, \
-    gen_simple_exponential_smoothing
+    gen_simple_exponential_smoothing, create_estimators, ExponentialSmoothing, EwmaRate, \
+    WindowRate, RegressionRate, SimpleEta
 
 
 @pytest.mark.parametrize('elapsed, conf, expected', [
@@ -61,3 +62,49 @@ def test_gen_simple_exponential_smoothing_eta():
     gen_eta.send(None)
     for i, (y, ses) in enumerate(data):
         assert gen_eta.send((y,)) == pytest.approx(ses)
+
+
+def test_exponential_smoothing_same_as_gen():
+    gen_rate = gen_simple_exponential_smoothing(.3, lambda pos, elapsed: pos / elapsed)
+    gen_rate.send(None)
+    rate = ExponentialSmoothing(.3, lambda pos, elapsed: pos / elapsed)
+    for pos, elapsed in ((0, 0.), (0, .1), (5, .2), (12, .3), (30, .5), (31, .9), (31, 1.)):
+        assert rate.update(pos, elapsed) == gen_rate.send((pos, elapsed))
+
+
+@pytest.mark.parametrize('estimator', [EwmaRate(), WindowRate(4), RegressionRate(4)])
+def test_rate_estimators_constant(estimator):
+    for t in (.5, 1., 1.1, 3., 3., 3.2, 7.):  # irregular deltas, and a repeated one.
+        assert estimator.update(10. * t, t) == pytest.approx(10.)
+
+
+@pytest.mark.parametrize('estimator, expected', [
+    (WindowRate(4), 100.),
+    (RegressionRate(4), 100.),
+    (EwmaRate(.5), pytest.approx(100., rel=.01)),
+])
+def test_rate_estimators_forget(estimator, expected):
+    for t in range(1, 11):  # 10/s, then 100/s.
+        estimator.update(10. * min(t, 5) + 100. * max(0, t - 5), float(t))
+    assert estimator.update(50. + 100. * 6, 11.) == expected
+
+
+@pytest.mark.parametrize('pos, rate, expected', [
+    (20, 10., 8.),
+    (20, 0., -1.),
+])
+def test_simple_eta_estimator(pos, rate, expected):
+    assert SimpleEta(100).update(pos, rate) == expected
+
+
+@pytest.mark.parametrize('name, rate_type, eta_type', [
+    ('smooth', ExponentialSmoothing, ExponentialSmoothing),
+    ('ewma', EwmaRate, SimpleEta),
+    ('window', WindowRate, SimpleEta),
+    ('regression', RegressionRate, SimpleEta),
+])
+def test_create_estimators(name, rate_type, eta_type):
+    rate, eta = create_estimators(name, 100)
+    assert type(rate) is rate_type and type(eta) is eta_type
+    with pytest.raises(AttributeError):
+        rate.anything = 1  # slotted.